@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional
 import requests
 
 from config import config
+from core.http_client import get_http_session
 from core.rpa_engine import check_should_stop, set_should_stop, stoppable_sleep
 from core.s3_client import get_s3_client
 from logger import logger
@@ -396,7 +397,7 @@ class AgentRunner:
         }
 
         try:
-            response = requests.post(
+            response = get_http_session().post(
                 self.n8n_webhook_url,
                 json=payload,
                 timeout=self.request_timeout,
@@ -520,7 +521,7 @@ class AgentRunner:
                 ],
             }
 
-            requests.post(callback_url, json=payload, timeout=10)
+            get_http_session().post(callback_url, json=payload, timeout=10)
             logger.info(f"[AGENT] Callback sent to {callback_url}")
 
         except Exception as e:
@@ -25,6 +25,8 @@ def create_gemini_model(
     model_name: str = "gemini-3-flash-preview",
     temperature: float = 0.2,
     max_retries: int = 2,
+    response_mime_type: Optional[str] = None,
+    response_schema: Optional[dict] = None,
 ) -> ChatGoogleGenerativeAI:
     """
     Create a ChatGoogleGenerativeAI model instance.
@@ -33,17 +35,28 @@ def create_gemini_model(
         model_name: Gemini model to use
         temperature: Sampling temperature
         max_retries: Number of retries on API errors
+        response_mime_type: Output format, e.g. "application/json" for
+            native JSON mode (no markdown fences around the answer)
+        response_schema: JSON schema the output must follow (needs
+            response_mime_type="application/json")
 
     Returns:
         Configured ChatGoogleGenerativeAI instance
     """
     api_key = get_gemini_api_key()
 
+    extra = {}
+    if response_mime_type:
+        extra["response_mime_type"] = response_mime_type
+    if response_schema:
+        extra["response_schema"] = response_schema
+
     model = ChatGoogleGenerativeAI(
         model=model_name,
         google_api_key=api_key,
         temperature=temperature,
         max_retries=max_retries,
+        **extra,
     )
 
     logger.info(f"[LLM] Created Gemini model: {model_name}")
@@ -20,6 +20,7 @@ import pyautogui
 from config import config
 from core.rpa_engine import RPABotBase
 from core.vdi_input import stoppable_sleep
+from core.vision import locate
 from logger import logger
 
 from agentic.emr.steward.patient_finder import PatientFinderAgent
@@ -316,7 +317,7 @@ class StewardLabRunner:
         # Check for confidentiality modal
         confidential_img = config.get_rpa_setting("images.steward_yes_btn_modal_confidential")
         try:
-            modal = pyautogui.locateOnScreen(confidential_img, confidence=0.7)
+            modal = locate(confidential_img, None, 0.7)
             if modal:
                 logger.info("[LAB-RUNNER] Confidentiality modal detected - clicking Yes")
                 pyautogui.click(modal)
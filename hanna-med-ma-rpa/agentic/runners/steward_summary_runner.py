@@ -27,6 +27,7 @@ import pyautogui
 from logger import logger
 from config import config
 from core.rpa_engine import RPABotBase
+from core.vision import grab_screen, locate
 from agentic.emr.steward.patient_finder import PatientFinderAgent
 from agentic.emr.steward.reason_finder import ReasonFinderAgent
 from agentic.emr.steward.report_finder import ReportFinderAgent
@@ -412,7 +413,7 @@ class StewardSummaryRunner:
         # Check for confidentiality modal
         confidential_img = config.get_rpa_setting("images.steward_yes_btn_modal_confidential")
         try:
-            modal = pyautogui.locateOnScreen(confidential_img, confidence=0.7)
+            modal = locate(confidential_img, None, 0.7)
             if modal:
                 logger.info("[RUNNER] Confidentiality modal detected - clicking Yes")
                 pyautogui.click(modal)
@@ -448,9 +449,15 @@ class StewardSummaryRunner:
 
         max_wait = 10  # Max seconds to wait
         for attempt in range(max_wait):
+            # One capture per attempt, shared by both checks
+            try:
+                screen = grab_screen()
+            except Exception:
+                screen = None
+
             # Check for Orders view
             try:
-                location = pyautogui.locateOnScreen(orders_view_image, confidence=0.8)
+                location = locate(orders_view_image, screen, 0.8)
                 if location:
                     self._record_step(
                         "rpa", "verify_orders_view", "Orders view confirmed visible"
@@ -462,9 +469,7 @@ class StewardSummaryRunner:
 
             # Check for "No patient selected" modal
             try:
-                modal_location = pyautogui.locateOnScreen(
-                    no_patient_image, confidence=0.8
-                )
+                modal_location = locate(no_patient_image, screen, 0.8)
                 if modal_location:
                     logger.warning(
                         "[RUNNER] 'No patient selected' modal detected - "
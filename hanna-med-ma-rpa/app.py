@@ -9,52 +9,68 @@ This is a headless RPA service that:
 No GUI. No Cloudflare. No n8n webhooks.
 """
 
+import os
 import signal
 import sys
-import time
 
 from config import config
-from core.rpa_engine import set_should_stop
-from logger import logger
+from logger import logger, start_queue_logging, stop_queue_logging
 from rpa_node import RpaNode
 
+# Exit status when a flow got stuck past its timeout, so the supervisor
+# (service manager / scheduled task) restarts the node
+EXIT_FLOW_STUCK = 3
 
-def signal_handler(sig, frame):
-    """Handle Ctrl+C gracefully."""
-    logger.info("Shutdown signal received. Stopping RPA node...")
-    set_should_stop(True)
-    sys.exit(0)
 
+def install_signal_handlers(node: RpaNode):
+    """Route Ctrl+C / SIGTERM to a graceful node shutdown."""
 
-signal.signal(signal.SIGINT, signal_handler)
+    def signal_handler(sig, frame):
+        logger.info("Shutdown signal received. Stopping RPA node...")
+        node.stop()
+
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
 
 
 def main():
     """Main entry point for headless RPA node."""
+    start_queue_logging(logger)
+
     logger.info("=" * 60)
     logger.info("  Hanna-Med RPA Node — Starting (Headless Mode)")
     logger.info("=" * 60)
 
     node = RpaNode()
-
-    # Step 1: Register with backend (or confirm registration)
-    if not node.register():
-        logger.error("Failed to register with backend. Exiting.")
-        sys.exit(1)
-
-    # Step 2: Check current assignment status
-    node.wait_for_assignment(timeout_seconds=0)
-
-    if node.doctor_id:
-        logger.info(f"Node initially assigned to Doctor ID: {node.doctor_id}")
-    else:
-        logger.info("Node is PENDING assignment. Will keep checking automatically.")
-
-    # Step 3: Start the Redis listener (background thread)
-    node.start_redis_listener()
-
-    # Step 4: Start the extraction loop (main thread)
-    node.run_extraction_loop()
+    install_signal_handlers(node)
+
+    try:
+        # Step 1: Register with backend (or confirm registration)
+        if not node.register():
+            logger.error("Failed to register with backend. Exiting.")
+            sys.exit(1)
+
+        # Step 2: Check current assignment status
+        node.wait_for_assignment(timeout_seconds=0)
+
+        if node.doctor_id:
+            logger.info(f"Node initially assigned to Doctor ID: {node.doctor_id}")
+        else:
+            logger.info("Node is PENDING assignment. Will keep checking automatically.")
+
+        # Step 3: Start the Redis listener (background thread)
+        node.start_redis_listener()
+
+        # Step 4: Start the extraction loop (main thread)
+        node.run_extraction_loop()
+    finally:
+        node.close()
+        logger.info("RPA node stopped.")
+        stop_queue_logging()
+
+    if node.flow_worker_stuck:
+        # A normal exit would wait forever on the stuck flow thread
+        os._exit(EXIT_FLOW_STUCK)
 
 
 if __name__ == "__main__":
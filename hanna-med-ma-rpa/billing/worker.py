@@ -22,9 +22,8 @@ from collections import deque
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-import requests
-
 from config import config
+from core.http_client import get_http_session
 from core.redis_scheduler import enqueue_with_delay
 
 logger = logging.getLogger(__name__)
@@ -193,10 +192,10 @@ class BillingNoteWorker:
         flow = BaptistNoteFlow()
 
         # Get credentials for Baptist
-        from flows.base_flow import _load_uuid
+        from core.node_uuid import get_uuid
         try:
-            rpa_uuid = _load_uuid()
-            response = requests.get(
+            rpa_uuid = get_uuid()
+            response = get_http_session().get(
                 f"{self.backend_url}/rpa/{rpa_uuid}/config", timeout=15
             )
             if response.status_code == 200:
@@ -229,7 +228,7 @@ class BillingNoteWorker:
 
         try:
             url = f"{self.backend_url}/rpa/encounters/{encounter_id}/note"
-            response = requests.patch(url, json=data, timeout=15)
+            response = get_http_session().patch(url, json=data, timeout=15)
 
             if response.status_code in (200, 201):
                 logger.info(
@@ -5,9 +5,9 @@ when a message is received from Redis.
 
 import json
 import logging
-import requests
 
 from config import config
+from core.http_client import get_http_session
 from caretracker.service import parse_registration_payload, run_registration
 
 logger = logging.getLogger(__name__)
@@ -39,7 +39,7 @@ def send_caretracker_result(patient_id: int, result: dict):
 
     try:
         logger.info(f"Sending CareTracker result to {url} for patient {patient_id} (status={payload['status']})")
-        resp = requests.post(url, json=payload, timeout=30)
+        resp = get_http_session().post(url, json=payload, timeout=30)
         
         if resp.status_code in [200, 201]:
             logger.info(f"Successfully sent result for patient {patient_id}")
@@ -53,6 +53,18 @@ class Config:
         except Exception:
             RPA_CONFIG = {}
 
+    # Shared ConfigManager so its load cache survives across lookups
+    _config_manager = None
+
+    @staticmethod
+    def get_config_manager():
+        """Get the process-wide ConfigManager instance"""
+        if Config._config_manager is None:
+            from config_manager import ConfigManager
+
+            Config._config_manager = ConfigManager()
+        return Config._config_manager
+
     @staticmethod
     def get_app_dir() -> Path:
         """Get application directory based on OS"""
@@ -131,9 +143,7 @@ class Config:
     def get_screen_resolution():
         """Get configured screen resolution or default"""
         # Try to get from persisted config first (saved by user in GUI)
-        from config_manager import ConfigManager
-
-        cm = ConfigManager()
+        cm = Config.get_config_manager()
         saved_config = cm.load_config()
         if saved_config and "screen_resolution" in saved_config:
             return saved_config["screen_resolution"]
@@ -144,9 +154,7 @@ class Config:
     @staticmethod
     def set_screen_resolution(resolution: str):
         """Save screen resolution to persistent config"""
-        from config_manager import ConfigManager
-
-        cm = ConfigManager()
+        cm = Config.get_config_manager()
         config_data = cm.load_config() or {}
         config_data["screen_resolution"] = resolution
         return cm.save_config(config_data)
@@ -229,6 +237,29 @@ class Config:
 
         return rois
 
+    @staticmethod
+    def get_region(emr_type: str, name: str):
+        """
+        Get a single search region for an EMR at the current resolution.
+
+        Args:
+            emr_type: EMR type ('jackson', 'baptist' or 'steward')
+            name: Region name (e.g., 'fullscreen_btn', 'lobby')
+
+        Returns:
+            (x, y, w, h) tuple, or None if not configured.
+        """
+        resolution = Config.get_screen_resolution()
+        region = (
+            Config.RPA_CONFIG.get("roi_regions", {})
+            .get(emr_type, {})
+            .get(resolution, {})
+            .get(name)
+        )
+        if not region:
+            return None
+        return (region["x"], region["y"], region["w"], region["h"])
+
     @staticmethod
     def get_timeout(timeout_name: str, default: int = 60) -> int:
         """Get specific timeout value in seconds"""
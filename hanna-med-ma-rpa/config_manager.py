@@ -7,6 +7,26 @@ import os
 from pathlib import Path
 from typing import Optional, Dict, Any
 from config import config
+from logger import logger
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize config data to indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Parse config data from JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
 
 
 class ConfigManager:
@@ -16,30 +36,45 @@ class ConfigManager:
         self.config_dir = config.get_app_dir()
         self.config_file = self.config_dir / "rpa_config.json"
 
+        # Parsed config, reused until the file's mtime changes
+        self._cached: Optional[Dict[str, Any]] = None
+        self._cached_mtime_ns: int = -1
+
         # Create directories if they don't exist
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
     def load_config(self) -> Optional[Dict[str, Any]]:
-        """Load configuration from disk"""
-        if not self.config_file.exists():
+        """Load configuration from disk (cached until the file changes)"""
+        try:
+            st = self.config_file.stat()
+        except FileNotFoundError:
             return None
 
+        if st.st_mtime_ns == self._cached_mtime_ns:
+            return self._cached
+
         try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading config: {e}")
+            self._cached = _loads(self.config_file.read_bytes())
+            self._cached_mtime_ns = st.st_mtime_ns
+            return self._cached
+        except Exception:
+            logger.exception("Error loading config")
             return None
 
     def save_config(self, config_data: Dict[str, Any]) -> bool:
         """Save configuration to disk"""
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(config_data, f, indent=2)
+            # Write to a sibling temp file and swap it in atomically so a
+            # crash mid-write never leaves a torn rpa_config.json behind
+            tmp = self.config_file.with_suffix(".json.tmp")
+            tmp.write_bytes(_dumps(config_data))
+            os.replace(tmp, self.config_file)
             return True
-        except Exception as e:
-            print(f"Error saving config: {e}")
+        except Exception:
+            logger.exception("Error saving config")
             return False
+        finally:
+            self._cached_mtime_ns = -1
 
     def clear_config(self) -> bool:
         """Clear all configuration"""
@@ -47,6 +82,8 @@ class ConfigManager:
             if self.config_file.exists():
                 self.config_file.unlink()
             return True
-        except Exception as e:
-            print(f"Error clearing config: {e}")
+        except Exception:
+            logger.exception("Error clearing config")
             return False
+        finally:
+            self._cached_mtime_ns = -1
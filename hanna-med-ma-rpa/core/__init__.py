@@ -2,7 +2,13 @@
 Core RPA module - Base utilities and infrastructure.
 """
 
-from .rpa_engine import RPABotBase, rpa_state, rpa_should_stop, set_should_stop
+from .rpa_engine import (
+    RPABotBase,
+    TaskCancelled,
+    rpa_state,
+    rpa_should_stop,
+    set_should_stop,
+)
 from .system_utils import (
     keep_system_awake,
     allow_system_sleep,
@@ -29,6 +35,7 @@ __all__ = [
     "rpa_state",
     "rpa_should_stop",
     "set_should_stop",
+    "TaskCancelled",
     "keep_system_awake",
     "allow_system_sleep",
     "send_key_windows",
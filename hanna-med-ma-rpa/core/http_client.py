@@ -0,0 +1,67 @@
+"""
+HTTP Client - Process-wide pooled session for backend and API calls.
+Reuses keep-alive connections so each request skips the TCP/TLS handshake.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Distinct hosts kept in the pool (backend, Vision, n8n, ...)
+POOL_CONNECTIONS = 8
+# Connections kept per host; covers the main loop plus listener threads
+POOL_MAXSIZE = 16
+
+
+def _build_session() -> requests.Session:
+    """
+    Build the shared HTTP session.
+
+    Failed connection attempts (nothing was sent) are retried inside urllib3
+    with exponential backoff for every method. Gateway errors and read
+    timeouts are retried only for GET/HEAD: a POST/PATCH (ingests, error
+    reports, agent runs, paid Vision/Gemini calls) may already have been
+    processed, so it is never sent twice automatically.
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Singleton instance for convenience
+_http_session = None
+_http_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Get singleton HTTP session instance."""
+    global _http_session
+    if _http_session is None:
+        with _http_lock:
+            if _http_session is None:
+                _http_session = _build_session()
+    return _http_session
+
+
+def close_http_session():
+    """Close the singleton HTTP session and drop its pooled connections."""
+    global _http_session
+    with _http_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
@@ -0,0 +1,79 @@
+"""
+Latency Stats - Rolling time-to-element samples per UI element.
+Used to tighten element-wait timeouts to what the VDI actually needs,
+persisted to disk so the history survives node restarts.
+"""
+
+import json
+import os
+import statistics
+import threading
+from collections import deque
+
+from config import config
+from logger import logger
+
+# Samples kept per element
+MAX_SAMPLES = 32
+# No adapting until an element has been seen this many times
+MIN_SAMPLES = 8
+# Adapted timeout = p95 of the samples times this margin
+P95_MARGIN = 1.5
+# Adapted timeouts never go below this (seconds)
+MIN_TIMEOUT = 5.0
+
+
+class LatencyStats:
+    """Per-key rolling latency samples, stored in one JSON file."""
+
+    def __init__(self, path=None):
+        self.path = path or config.get_app_dir() / "element_latency.json"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._samples = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            for key, values in data.items():
+                self._samples[key] = deque(values, maxlen=MAX_SAMPLES)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"[LATENCY] Could not read {self.path.name}: {e}")
+
+    def record(self, key: str, seconds: float):
+        """Add a successful wait's duration and persist."""
+        with self._lock:
+            samples = self._samples.setdefault(key, deque(maxlen=MAX_SAMPLES))
+            samples.append(round(seconds, 2))
+            data = {k: list(v) for k, v in self._samples.items()}
+        tmp = self.path.with_suffix(".json.tmp")
+        try:
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.warning(f"[LATENCY] Could not write {self.path.name}: {e}")
+
+    def timeout_for(self, key: str, configured: float) -> float:
+        """
+        Timeout for the next wait on `key`: p95 x margin of the recorded
+        samples, within [MIN_TIMEOUT, configured]. The configured timeout is
+        returned as-is until there are enough samples.
+        """
+        with self._lock:
+            samples = list(self._samples.get(key, ()))
+        if len(samples) < MIN_SAMPLES:
+            return configured
+        p95 = statistics.quantiles(samples, n=20)[-1]
+        return min(configured, max(MIN_TIMEOUT, p95 * P95_MARGIN))
+
+
+# Singleton instance for convenience
+_latency_stats = None
+
+
+def get_latency_stats() -> LatencyStats:
+    """Get singleton latency stats instance."""
+    global _latency_stats
+    if _latency_stats is None:
+        _latency_stats = LatencyStats()
+    return _latency_stats
@@ -0,0 +1,66 @@
+"""
+Node UUID - The RPA node's persistent identity, kept in rpa_uuid.json.
+The file is static for the life of the process, so it is read once and
+cached here for both the node and the flows.
+"""
+
+import json
+import os
+import uuid
+from pathlib import Path
+
+from logger import logger
+
+# Path to store the UUID persistently
+UUID_FILE = Path("rpa_uuid.json")
+
+_uuid = None
+
+
+def _read_uuid():
+    """UUID stored in rpa_uuid.json, or None if missing or unreadable."""
+    try:
+        data = json.loads(UUID_FILE.read_text())
+        if "uuid" in data:
+            return data["uuid"]
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, TypeError) as e:
+        logger.warning(f"UUID file is corrupt: {e}")
+    except Exception as e:
+        logger.warning(f"Could not read UUID file: {e}")
+    return None
+
+
+def get_or_create_uuid() -> str:
+    """Get the persisted UUID or generate and persist a new one."""
+    global _uuid
+    if _uuid is not None:
+        return _uuid
+
+    _uuid = _read_uuid()
+    if _uuid is not None:
+        return _uuid
+
+    new_uuid = str(uuid.uuid4())
+    # Write-then-rename so a crash mid-write can't leave a corrupt file
+    tmp = UUID_FILE.with_suffix(".tmp")
+    try:
+        tmp.write_text(json.dumps({"uuid": new_uuid}))
+        os.replace(tmp, UUID_FILE)
+    except Exception as e:
+        logger.warning(f"Could not persist UUID: {e}")
+
+    _uuid = new_uuid
+    return new_uuid
+
+
+def get_uuid() -> str:
+    """
+    RPA node UUID, or "unknown" if rpa_uuid.json doesn't exist yet.
+    Not cached while missing: the node may create it later.
+    """
+    global _uuid
+    if _uuid is None:
+        _uuid = _read_uuid()
+    return _uuid or "unknown"
@@ -0,0 +1,91 @@
+"""
+OCR Cache - Disk cache for OCR text and LLM-structured results.
+Entries are keyed by a content hash, so re-running a flow on a byte-identical
+document skips the paid Vision and Gemini calls.
+
+Entries hold patient data, so expired ones are deleted rather than just
+ignored: when read, and in a sweep of the whole directory at startup.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Optional
+
+from config import config
+from logger import logger
+
+# Entries older than this are ignored and overwritten
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+def content_hash(data) -> str:
+    """Short blake2b hex digest of bytes or str."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class OcrCache:
+    """JSON-file cache, one file per entry, expired by file age."""
+
+    def __init__(self, cache_dir=None, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.cache_dir = cache_dir or config.get_app_dir() / "ocr_cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.purge_expired()
+
+    def _expired(self, path) -> bool:
+        return time.time() - path.stat().st_mtime > self.ttl_seconds
+
+    def purge_expired(self):
+        """Delete expired entries and leftover temp files."""
+        for path in self.cache_dir.iterdir():
+            try:
+                if path.suffix == ".tmp" or self._expired(path):
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"[OCR-CACHE] Could not delete {path.name}: {e}")
+
+    def _path(self, kind: str, *key_parts):
+        key = content_hash("\0".join(str(part) for part in key_parts))
+        return self.cache_dir / f"{kind}_{key}.json"
+
+    def get(self, kind: str, *key_parts) -> Optional[Any]:
+        """Cached value, or None if missing or expired."""
+        path = self._path(kind, *key_parts)
+        try:
+            if self._expired(path):
+                path.unlink()
+                return None
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"[OCR-CACHE] Could not read {path.name}: {e}")
+            return None
+
+    def set(self, kind: str, *key_parts, value: Any):
+        """Store a JSON-serializable value (atomic replace)."""
+        path = self._path(kind, *key_parts)
+        tmp = path.with_suffix(".json.tmp")
+        try:
+            tmp.write_text(json.dumps(value), encoding="utf-8")
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"[OCR-CACHE] Could not write {path.name}: {e}")
+
+
+# Singleton instance for convenience
+_ocr_cache = None
+
+
+def get_ocr_cache() -> OcrCache:
+    """Get singleton OCR cache instance."""
+    global _ocr_cache
+    if _ocr_cache is None:
+        _ocr_cache = OcrCache()
+    return _ocr_cache
@@ -8,10 +8,16 @@ import threading
 import pyautogui
 
 from config import config
+from .vision import grab_screen, locate, locate_multiscale, pyramid_levels_for
 
 
 # --- Global State ---
 rpa_should_stop = False
+# Mirrors rpa_should_stop so sleepers can block on it instead of polling
+stop_event = threading.Event()
+# Set with the flag when a supervisor (not the user) cancels the running
+# task, e.g. on a task timeout; see set_should_stop()
+rpa_stop_reason = None
 rpa_state = {
     "status": "idle",
     "execution_id": None,
@@ -115,39 +121,54 @@ def mark_processor_finished():
         _queue_processor_active = False
 
 
-def set_should_stop(value: bool):
-    """Set the global should_stop flag."""
-    global rpa_should_stop
+class TaskCancelled(KeyboardInterrupt):
+    """
+    Raised by check_should_stop() when the task was cancelled by a
+    supervisor rather than stopped by the user. Whoever cancelled it
+    reports the error, so flows don't report it again.
+    """
+
+
+def set_should_stop(value: bool, reason: str = None):
+    """
+    Set the global should_stop flag. Passing a `reason` marks the stop as
+    a supervisor cancel: check_should_stop() then raises TaskCancelled.
+    """
+    global rpa_should_stop, rpa_stop_reason
     rpa_should_stop = value
+    rpa_stop_reason = reason if value else None
+    if value:
+        stop_event.set()
+    else:
+        stop_event.clear()
 
 
 def check_should_stop():
     """Checks if the RPA should stop and raises an exception."""
-    global rpa_should_stop
+    global rpa_should_stop, rpa_stop_reason
     if rpa_should_stop:
-        print("[STOP] RPA stopped by user")
+        reason = rpa_stop_reason
         # Clear the flag for the uvicorn handler
         rpa_should_stop = False
+        rpa_stop_reason = None
+        stop_event.clear()
+        if reason:
+            print(f"[STOP] RPA task cancelled: {reason}")
+            raise TaskCancelled(reason)
+        print("[STOP] RPA stopped by user")
         raise KeyboardInterrupt("RPA stopped by Ctrl+C")
 
 
 def stoppable_sleep(duration_s, check_interval_s=0.1):
     """
     Replacement of time.sleep() that can be interrupted by check_should_stop().
+    Blocks on stop_event, so a stop request wakes it immediately;
+    check_interval_s is kept for callers that still pass it.
     """
-    start_time = time.time()
-    while (time.time() - start_time) < duration_s:
+    check_should_stop()
+    if duration_s > 0 and stop_event.wait(timeout=duration_s):
         check_should_stop()
 
-        # Calculate how much to sleep to avoid going over
-        remaining = duration_s - (time.time() - start_time)
-        sleep_for = min(check_interval_s, remaining)
-
-        if sleep_for <= 0:
-            break
-
-        time.sleep(sleep_for)
-
 
 class RPABotBase:
     """
@@ -155,9 +176,18 @@ class RPABotBase:
     All hospital-specific flows should inherit from this.
     """
 
+    # Template scales tried by wait_for_element, native size first; flows
+    # whose VDI may render at another resolution can add more
+    TEMPLATE_SCALES = (1.0,)
+
     def __init__(self):
         self.should_stop = False
         self.confidence = config.get_rpa_setting("confidence", 0.8)
+        # Coarse-to-fine matching in wait_for_element (vision.downscale_factor,
+        # e.g. 0.5 = first search at half resolution; 1.0 = off)
+        self.pyramid_levels = pyramid_levels_for(
+            config.get_rpa_setting("vision.downscale_factor", 1.0)
+        )
 
     def start_session(self):
         """Start RPA session - keeps system awake."""
@@ -179,6 +209,13 @@ class RPABotBase:
         """Sleep that can be interrupted."""
         stoppable_sleep(duration_s, check_interval_s)
 
+    def template_region(self, image_path):
+        """
+        Search region (x, y, w, h) for a template, or None to search the
+        whole screen. Flows whose elements sit at fixed places override this.
+        """
+        return None
+
     def wait_for_element(
         self,
         image_path,
@@ -187,12 +224,19 @@ class RPABotBase:
         check_interval=0.5,
         description="element",
         auto_click=False,
+        region=None,
     ):
-        """Wait until an element appears on screen."""
+        """
+        Wait until an element appears on screen.
+        `region` (x, y, w, h) limits the search; by default it comes from
+        template_region().
+        """
         if timeout is None:
             timeout = config.get_timeout("default")
         if confidence is None:
             confidence = self.confidence
+        if region is None:
+            region = self.template_region(image_path)
 
         print(f"[WAIT] Waiting for {description} (timeout: {timeout}s)")
         start_time = time.time()
@@ -202,14 +246,28 @@ class RPABotBase:
             self.check_stop()
 
             try:
-                location = pyautogui.locateOnScreen(image_path, confidence=confidence)
+                location = locate_multiscale(
+                    image_path,
+                    None,
+                    confidence,
+                    region,
+                    self.TEMPLATE_SCALES,
+                    self.pyramid_levels,
+                )
                 if location:
                     elapsed = round(time.time() - start_time, 1)
                     print(f"[WAIT] {description} found after {elapsed}s")
                     self.stoppable_sleep(1)
                     try:
                         confirmed_location = (
-                            pyautogui.locateOnScreen(image_path, confidence=confidence)
+                            locate_multiscale(
+                                image_path,
+                                None,
+                                confidence,
+                                region,
+                                self.TEMPLATE_SCALES,
+                                self.pyramid_levels,
+                            )
                             or location
                         )
                     except Exception:
@@ -229,6 +287,73 @@ class RPABotBase:
         print(f"[WAIT] Timeout: {description} not found")
         return None
 
+    def wait_for_any_element(
+        self,
+        image_paths,
+        timeout=None,
+        confidence=None,
+        check_interval=0.5,
+        description="element",
+    ):
+        """
+        Wait until any of several elements appears on screen (e.g. a tab and
+        its fallback). All templates are matched against one screenshot per
+        poll; earlier paths win when several are visible.
+
+        Returns:
+            (index, location) of the element found, or (None, None)
+        """
+        if timeout is None:
+            timeout = config.get_timeout("default")
+        if confidence is None:
+            confidence = self.confidence
+
+        print(f"[WAIT] Waiting for {description} (timeout: {timeout}s)")
+        start_time = time.time()
+
+        while (time.time() - start_time) < timeout:
+            self.check_stop()
+
+            try:
+                screen = grab_screen()
+                for index, image_path in enumerate(image_paths):
+                    location = locate_multiscale(
+                        image_path,
+                        screen,
+                        confidence,
+                        self.template_region(image_path),
+                        self.TEMPLATE_SCALES,
+                        self.pyramid_levels,
+                    )
+                    if not location:
+                        continue
+                    elapsed = round(time.time() - start_time, 1)
+                    print(f"[WAIT] {description} #{index} found after {elapsed}s")
+                    self.stoppable_sleep(1)
+                    try:
+                        location = (
+                            locate_multiscale(
+                                image_path,
+                                None,
+                                confidence,
+                                self.template_region(image_path),
+                                self.TEMPLATE_SCALES,
+                                self.pyramid_levels,
+                            )
+                            or location
+                        )
+                    except Exception:
+                        pass
+                    self.stoppable_sleep(1)
+                    return index, location
+            except Exception as e:
+                print(f"[WAIT] Error: {str(e)}")
+
+            time.sleep(check_interval)
+
+        print(f"[WAIT] Timeout: {description} not found")
+        return None, None
+
     def robust_wait_for_element(
         self,
         target_image_path,
@@ -261,10 +386,16 @@ class RPABotBase:
 
         while (time.time() - start_time) < timeout:
             self.check_stop()
+            # One capture per tick, shared by the target and every obstacle
+            screen = None
             try:
+                screen = grab_screen()
                 # Search for the primary target
-                location = pyautogui.locateOnScreen(
-                    target_image_path, confidence=confidence
+                location = locate(
+                    target_image_path,
+                    screen,
+                    confidence,
+                    self.template_region(target_image_path),
                 )
                 if location:
                     elapsed = round(time.time() - start_time, 1)
@@ -274,8 +405,11 @@ class RPABotBase:
                     self.stoppable_sleep(1)
                     try:
                         confirmed_location = (
-                            pyautogui.locateOnScreen(
-                                target_image_path, confidence=confidence
+                            locate(
+                                target_image_path,
+                                None,
+                                confidence,
+                                self.template_region(target_image_path),
                             )
                             or location
                         )
@@ -293,9 +427,14 @@ class RPABotBase:
             # If not found, search for obstacles
             obstacle_handled = False
             for obstacle_image, (obs_desc, handler_func) in handlers.items():
+                if screen is None:
+                    break
                 try:
-                    obstacle_loc = pyautogui.locateOnScreen(
-                        obstacle_image, confidence=confidence
+                    obstacle_loc = locate(
+                        obstacle_image,
+                        screen,
+                        confidence,
+                        self.template_region(obstacle_image),
                     )
                     if obstacle_loc:
                         print(f"\n[HANDLER] Obstacle detected: {obs_desc}")
@@ -333,7 +472,7 @@ class RPABotBase:
             self.check_stop()
 
             try:
-                location = pyautogui.locateOnScreen(image_path, confidence=confidence)
+                location = locate(image_path, None, confidence)
                 if not location:
                     elapsed = round(time.time() - start_time, 1)
                     print(f"[WAIT] {description} disappeared after {elapsed}s")
@@ -11,9 +11,24 @@ from typing import List, Optional
 
 import boto3
 import pyautogui
+from boto3.s3.transfer import TransferConfig
 
 from config import config
 
+# Split larger uploads into parts sent on parallel threads
+_TRANSFER_CONFIG = TransferConfig(multipart_threshold=1024 * 1024, use_threads=True)
+
+# Screenshots only feed OCR, which re-encodes them to JPEG; an uncompressed
+# bitmap skips PNG's DEFLATE pass without adding a second lossy encode
+OCR_CAPTURE_FORMAT = "BMP"
+
+_CONTENT_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+}
+
 
 class S3Client:
     """AWS S3 client for RPA file operations."""
@@ -43,17 +58,29 @@ class S3Client:
             )
         return self._client
 
-    def take_screenshot(self):
-        """Takes a screenshot and returns it as bytes."""
+    def take_screenshot(self, fmt: str = "png", quality: int = 90):
+        """
+        Takes a screenshot and returns it as bytes.
+
+        Args:
+            fmt: "png" (lossless) or "jpeg" (much smaller and faster to encode)
+            quality: JPEG quality, ignored for PNG
+        """
         screenshot = pyautogui.screenshot()
         img_buffer = BytesIO()
-        screenshot.save(img_buffer, format="PNG")
+        if fmt.lower() in ("jpg", "jpeg"):
+            screenshot.convert("RGB").save(img_buffer, format="JPEG", quality=quality)
+        else:
+            screenshot.save(img_buffer, format="PNG")
         img_buffer.seek(0)
         return img_buffer
 
     def upload_image(self, img_buffer, filename):
         """Upload an image to S3."""
         print(f"[S3] Uploading: {filename}")
+        content_type = _CONTENT_TYPES.get(
+            os.path.splitext(filename)[1].lower(), "image/png"
+        )
 
         try:
             client = self._get_client()
@@ -61,7 +88,8 @@ class S3Client:
                 img_buffer,
                 self.bucket_name,
                 filename,
-                ExtraArgs={"ContentType": "image/png"},
+                ExtraArgs={"ContentType": content_type},
+                Config=_TRANSFER_CONFIG,
             )
             print(f"[S3] Upload successful")
             return filename
@@ -81,6 +109,7 @@ class S3Client:
                     self.bucket_name,
                     s3_filename,
                     ExtraArgs={"ContentType": "application/pdf"},
+                    Config=_TRANSFER_CONFIG,
                 )
             print("[S3] PDF upload successful")
             return s3_filename
@@ -132,6 +161,7 @@ class S3Client:
             if enhance:
                 image_b64 = capturer.capture_with_mask_enhanced_base64(
                     rois,
+                    format=OCR_CAPTURE_FORMAT,
                     enhance=True,
                     upscale_factor=2.0,
                     contrast_factor=1.3,
@@ -141,10 +171,12 @@ class S3Client:
                     f"[SCREENSHOT] Applied ROI mask ({len(rois)} regions) + VDI enhancement"
                 )
             else:
-                image_b64 = capturer.capture_with_mask_base64(rois)
+                image_b64 = capturer.capture_with_mask_base64(
+                    rois, format=OCR_CAPTURE_FORMAT
+                )
                 print(f"[SCREENSHOT] Applied ROI mask ({len(rois)} regions)")
         else:
-            image_b64 = capturer.capture_base64()
+            image_b64 = capturer.capture_base64(format=OCR_CAPTURE_FORMAT)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
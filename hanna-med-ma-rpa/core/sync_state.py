@@ -0,0 +1,88 @@
+"""
+Sync State - Per-doctor, per-hospital sync watermarks stored in SQLite.
+Each watermark is a single-row upsert, kept across node restarts.
+"""
+
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+
+from config import config
+
+
+class SyncStateStore:
+    """SQLite-backed store for extraction sync watermarks."""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or config.get_app_dir() / "rpa_state.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sync_state (
+                doctor_id TEXT NOT NULL,
+                hospital_type TEXT NOT NULL,
+                last_modified TEXT,
+                last_id TEXT,
+                PRIMARY KEY (doctor_id, hospital_type)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_watermarks(self, doctor_id) -> Dict[str, Dict[str, Any]]:
+        """Get the watermarks of every hospital for a doctor."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT hospital_type, last_modified, last_id "
+                "FROM sync_state WHERE doctor_id = ?",
+                (str(doctor_id),),
+            ).fetchall()
+        return {
+            hospital_type: {"last_modified": last_modified, "last_id": last_id}
+            for hospital_type, last_modified, last_id in rows
+        }
+
+    def upsert_watermark(
+        self,
+        doctor_id,
+        hospital_type: str,
+        last_modified: Optional[str],
+        last_id: Optional[str] = None,
+    ):
+        """Insert or update the watermark of one hospital for a doctor."""
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO sync_state (doctor_id, hospital_type, last_modified, last_id)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(doctor_id, hospital_type) DO UPDATE SET
+                    last_modified = excluded.last_modified,
+                    last_id = excluded.last_id
+                """,
+                (str(doctor_id), hospital_type, last_modified, last_id),
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        global _sync_state_store
+        with self._lock:
+            self._conn.close()
+        if _sync_state_store is self:
+            _sync_state_store = None
+
+
+# Singleton instance for convenience
+_sync_state_store = None
+
+
+def get_sync_state_store() -> SyncStateStore:
+    """Get singleton sync state store instance."""
+    global _sync_state_store
+    if _sync_state_store is None:
+        _sync_state_store = SyncStateStore()
+    return _sync_state_store
@@ -29,6 +29,23 @@ if platform.system() == "Windows":
     VK_DOWN = 0x28
     VK_F5 = 0x74
 
+    # Clipboard API constants
+    CF_UNICODETEXT = 13
+    GMEM_MOVEABLE = 0x0002
+
+    # Handles are pointer-sized; without these the 64-bit values get truncated
+    _user32 = ctypes.windll.user32
+    _kernel32 = ctypes.windll.kernel32
+    _user32.OpenClipboard.argtypes = [wintypes.HWND]
+    _user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    _user32.SetClipboardData.restype = wintypes.HANDLE
+    _kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    _kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    _kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    _kernel32.GlobalLock.restype = wintypes.LPVOID
+    _kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    _kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+
     # Define Windows structures
     class KEYBDINPUT(ctypes.Structure):
         _fields_ = [
@@ -39,9 +56,33 @@ if platform.system() == "Windows":
             ("dwExtraInfo", ctypes.POINTER(wintypes.ULONG)),
         ]
 
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.POINTER(wintypes.ULONG)),
+        ]
+
+    class HARDWAREINPUT(ctypes.Structure):
+        _fields_ = [
+            ("uMsg", wintypes.DWORD),
+            ("wParamL", wintypes.WORD),
+            ("wParamH", wintypes.WORD),
+        ]
+
     class INPUT(ctypes.Structure):
+        # All three members are needed for sizeof(INPUT) to match what
+        # SendInput expects (40 bytes on 64-bit); with a smaller size it
+        # rejects the whole batch
         class _INPUT(ctypes.Union):
-            _fields_ = [("ki", KEYBDINPUT)]
+            _fields_ = [
+                ("ki", KEYBDINPUT),
+                ("mi", MOUSEINPUT),
+                ("hi", HARDWAREINPUT),
+            ]
 
         _anonymous_ = ("_input",)
         _fields_ = [("type", wintypes.DWORD), ("_input", _INPUT)]
@@ -63,6 +104,8 @@ else:
     VK_UP = 0x26
     VK_DOWN = 0x28
     VK_F5 = 0x74
+    CF_UNICODETEXT = 13
+    GMEM_MOVEABLE = 0x0002
 
     class KEYBDINPUT:
         pass
@@ -170,3 +213,77 @@ def send_text_windows(text):
     ctypes.windll.user32.SendInput(
         len(inputs_list), ctypes.byref(inputs_array), ctypes.sizeof(INPUT)
     )
+
+
+def send_hotkey_windows(vk_codes):
+    """
+    Send a key combination (e.g. Ctrl+L) as one SendInput call.
+    Keys go down in order and up in reverse order. Like pydirectinput, the
+    events carry hardware scan codes, which VDI clients pick up reliably.
+    vk_codes: Virtual key codes, modifiers first (e.g., [VK_CONTROL, 0x4C])
+    """
+    if platform.system() != "Windows":
+        raise Exception("send_hotkey_windows only works on Windows")
+
+    map_virtual_key = ctypes.windll.user32.MapVirtualKeyW
+    scan_codes = [map_virtual_key(vk_code, 0) for vk_code in vk_codes]
+
+    inputs_list = []
+    for scan_code in scan_codes:
+        input_down = INPUT()
+        input_down.type = INPUT_KEYBOARD
+        input_down.ki = KEYBDINPUT(0, scan_code, KEYEVENTF_SCANCODE, 0, None)
+        inputs_list.append(input_down)
+
+    for scan_code in reversed(scan_codes):
+        input_up = INPUT()
+        input_up.type = INPUT_KEYBOARD
+        input_up.ki = KEYBDINPUT(
+            0, scan_code, KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP, 0, None
+        )
+        inputs_list.append(input_up)
+
+    inputs_array = (INPUT * len(inputs_list))(*inputs_list)
+    sent = ctypes.windll.user32.SendInput(
+        len(inputs_list), ctypes.byref(inputs_array), ctypes.sizeof(INPUT)
+    )
+    if sent != len(inputs_list):
+        raise OSError(f"SendInput sent {sent} of {len(inputs_list)} key events")
+
+
+def set_clipboard_text_windows(text, retries=1):
+    """
+    Replace the clipboard contents with `text` in one open/empty/set/close
+    sequence, so no stale data can be pasted in between and no settle sleep
+    is needed. Retries once if another process holds the clipboard open.
+    """
+    if platform.system() != "Windows":
+        raise Exception("set_clipboard_text_windows only works on Windows")
+
+    import time
+
+    for attempt in range(retries + 1):
+        if _user32.OpenClipboard(None):
+            break
+        if attempt == retries:
+            raise OSError("Clipboard is in use by another process")
+        time.sleep(0.05)
+
+    try:
+        _user32.EmptyClipboard()
+
+        data = ctypes.create_unicode_buffer(text)
+        size = ctypes.sizeof(data)
+        handle = _kernel32.GlobalAlloc(GMEM_MOVEABLE, size)
+        if not handle:
+            raise OSError("GlobalAlloc failed")
+        locked = _kernel32.GlobalLock(handle)
+        ctypes.memmove(locked, data, size)
+        _kernel32.GlobalUnlock(handle)
+
+        # On success the clipboard owns the memory; free it only on failure
+        if not _user32.SetClipboardData(CF_UNICODETEXT, handle):
+            _kernel32.GlobalFree(handle)
+            raise OSError("SetClipboardData failed")
+    finally:
+        _user32.CloseClipboard()
@@ -3,6 +3,8 @@ VDI-compatible input methods.
 Provides reliable text input and key presses for VDI/Citrix environments.
 """
 
+import time
+
 import pyautogui
 import pydirectinput
 import pyperclip
@@ -10,8 +12,13 @@ import pyperclip
 from logger import logger
 
 from .system_utils import (
+    send_hotkey_windows,
     send_key_windows,
     send_text_windows,
+    set_clipboard_text_windows,
+    VK_CONTROL,
+    VK_SHIFT,
+    VK_MENU,
     VK_TAB,
     VK_RETURN,
     VK_LEFT,
@@ -27,21 +34,28 @@ def stoppable_sleep(duration_s, check_interval_s=0.1):
     Replacement of time.sleep() that can be interrupted by check_should_stop().
     Imported here and re-exported for convenience.
     """
-    import time
-    from .rpa_engine import check_should_stop
+    from .rpa_engine import stoppable_sleep as _stoppable_sleep
 
-    start_time = time.time()
-    while (time.time() - start_time) < duration_s:
-        check_should_stop()
+    _stoppable_sleep(duration_s, check_interval_s)
 
-        # Calculate how much to sleep to avoid going over
-        remaining = duration_s - (time.time() - start_time)
-        sleep_for = min(check_interval_s, remaining)
 
-        if sleep_for <= 0:
-            break
+def set_clipboard(text):
+    """
+    Put text on the local clipboard, replacing whatever was there.
+    Uses a single Win32 clipboard transaction; elsewhere (or if that fails)
+    falls back to pyperclip with a clear first to avoid stale data.
+    """
+    try:
+        set_clipboard_text_windows(text)
+        return
+    except Exception as e:
+        logger.debug(f"[CLIPBOARD] Win32 set failed ({e}), using pyperclip")
 
-        time.sleep(sleep_for)
+    pyperclip.copy("")
+    # Plain sleep: this may run off the flow thread, where a stop request
+    # must not be consumed
+    time.sleep(0.5)
+    pyperclip.copy(text)
 
 
 def type_with_clipboard(text):
@@ -88,13 +102,18 @@ def type_with_clipboard(text):
             raise
 
 
-def press_key_vdi(key_name):
+def press_key_vdi(key_name, presses=1, interval=0.1):
     """
     Press a key in VDI environment using pydirectinput (DirectInput).
     DirectInput works better than SendInput for VDI environments.
+
+    Args:
+        key_name: Key to press (e.g. "tab", "down")
+        presses: Number of presses, sent in one pydirectinput call
+        interval: Seconds between repeated presses
     """
     try:
-        pydirectinput.press(key_name)
+        pydirectinput.press(key_name, presses=presses, interval=interval)
         stoppable_sleep(0.2)
     except Exception as e:
         logger.warning(
@@ -119,13 +138,60 @@ def press_key_vdi(key_name):
 
         try:
             vk_code = key_map[key_lower]
-            send_key_windows(vk_code)
+            for press in range(presses):
+                if press:
+                    stoppable_sleep(interval)
+                send_key_windows(vk_code)
             stoppable_sleep(0.2)
         except Exception as e2:
             logger.error(f"[KEY_PRESS] Fallback also failed: {e2}")
             raise
 
 
+# Key names accepted by send_hotkey_vdi, besides single letters and digits
+_HOTKEY_VK = {
+    "ctrl": VK_CONTROL,
+    "shift": VK_SHIFT,
+    "alt": VK_MENU,
+    "tab": VK_TAB,
+    "enter": VK_RETURN,
+    "f5": VK_F5,
+}
+
+
+def send_hotkey_vdi(keys):
+    """
+    Press a key combination, e.g. send_hotkey_vdi(("ctrl", "l")).
+    All key events go out in a single SendInput batch instead of one
+    pydirectinput call (and debounce sleep) per key. They are scan-code
+    events, the same kind pydirectinput sends. Falls back to pydirectinput
+    if SendInput is unavailable or does not take every event.
+    """
+    try:
+        vk_codes = []
+        for key in keys:
+            key_lower = key.lower()
+            if key_lower in _HOTKEY_VK:
+                vk_codes.append(_HOTKEY_VK[key_lower])
+            elif len(key_lower) == 1 and key_lower.isalnum():
+                # Letter and digit virtual key codes match their uppercase ASCII
+                vk_codes.append(ord(key_lower.upper()))
+            else:
+                raise ValueError(f"Unknown key: {key}")
+        send_hotkey_windows(vk_codes)
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.warning(f"[HOTKEY] SendInput failed: {e}, falling back to pydirectinput")
+        for key in keys[:-1]:
+            pydirectinput.keyDown(key)
+            stoppable_sleep(0.2)
+        pydirectinput.press(keys[-1])
+        stoppable_sleep(0.2)
+        for key in reversed(keys[:-1]):
+            pydirectinput.keyUp(key)
+
+
 def type_via_alt_codes(text):
     """
     Type text using Alt+Numpad codes.
@@ -0,0 +1,320 @@
+"""
+Vision - Template matching helpers for on-screen element detection.
+
+Templates are decoded once and cached, and a single screenshot can be
+matched against several templates, instead of pyautogui.locateOnScreen
+re-reading the PNG and grabbing the full screen on every call.
+"""
+
+import base64
+import functools
+import math
+import threading
+from collections import namedtuple
+
+import cv2
+import numpy as np
+import pyautogui
+
+try:
+    import mss
+except ImportError:  # fall back to pyautogui's screenshot
+    mss = None
+
+# Same field layout as pyscreeze.Box, so pyautogui.center() accepts it
+Box = namedtuple("Box", "left top width height")
+
+# Templates are not downsampled below this size (px) in pyramid matching
+MIN_PYRAMID_SIDE = 12
+# Downsampling blurs the match, so coarse hits may score this much lower
+# than the confidence; the full-resolution refinement has the final say
+COARSE_SLACK = 0.1
+
+
+# Large enough for every template of the biggest flow (Steward: ~60)
+@functools.lru_cache(maxsize=256)
+def load_template(image_path: str) -> np.ndarray:
+    """Load and decode a template image (BGR), cached by path."""
+    template = cv2.imread(str(image_path), cv2.IMREAD_COLOR)
+    if template is None:
+        raise FileNotFoundError(f"Template image not found: {image_path}")
+    return template
+
+
+def preload_templates(image_paths, scales=(), pyramid_levels: int = 0) -> list:
+    """
+    Decode templates ahead of time so the first wait on each one doesn't pay
+    for the PNG decode. Also builds the resized variants for `scales` (as
+    used by locate_multiscale) and the grayscale pyramid when
+    pyramid_levels > 0 (as used by locate_pyramid).
+    Returns the paths that could not be loaded.
+    """
+    missing = []
+    for image_path in image_paths:
+        image_path = str(image_path)
+        try:
+            load_template(image_path)
+        except FileNotFoundError:
+            missing.append(image_path)
+            continue
+        for scale in scales:
+            if scale != 1.0:
+                _scaled_template(image_path, scale)
+        if pyramid_levels > 0:
+            _gray_pyramid(image_path, pyramid_levels)
+    return missing
+
+
+@functools.lru_cache(maxsize=1)
+def screen_size() -> tuple:
+    """
+    Primary screen (width, height), queried once per process.
+    The VDI session's resolution doesn't change while the node runs; call
+    screen_size.cache_clear() if it ever does.
+    """
+    width, height = pyautogui.size()
+    return width, height
+
+
+# mss grabbers hold per-thread OS handles, so keep one per thread
+_mss_local = threading.local()
+
+
+def grab_screen(gray: bool = False) -> np.ndarray:
+    """
+    Capture the primary screen as a BGR array.
+
+    With gray=True the capture is converted straight to a single-channel
+    image, for callers that only run locate_pyramid() on it: the per-template
+    BGR->gray pass of the whole screen is then skipped.
+    """
+    if mss is not None:
+        sct = getattr(_mss_local, "sct", None)
+        if sct is None:
+            sct = _mss_local.sct = mss.mss()
+        shot = np.asarray(sct.grab(sct.monitors[1]))
+        code = cv2.COLOR_BGRA2GRAY if gray else cv2.COLOR_BGRA2BGR
+    else:
+        shot = np.asarray(pyautogui.screenshot())
+        code = cv2.COLOR_RGB2GRAY if gray else cv2.COLOR_RGB2BGR
+    return cv2.cvtColor(shot, code)
+
+
+def locate(
+    image_path,
+    haystack: np.ndarray = None,
+    confidence: float = 0.8,
+    region=None,
+):
+    """
+    Find a template on the screen.
+
+    Args:
+        image_path: Path to the template image
+        haystack: Screenshot from grab_screen(); a new one is taken if None
+        confidence: Minimum normalized correlation to accept a match
+        region: Optional (x, y, w, h) to search instead of the whole screen
+
+    Returns:
+        Box of the best match (screen coordinates), or None if nothing
+        reaches the confidence
+    """
+    if haystack is None:
+        haystack = grab_screen()
+
+    offset_x, offset_y = 0, 0
+    if region:
+        x, y, w, h = region
+        haystack = haystack[y : y + h, x : x + w]
+        offset_x, offset_y = x, y
+
+    needle = load_template(str(image_path))
+    needle_h, needle_w = needle.shape[:2]
+    if needle_h > haystack.shape[0] or needle_w > haystack.shape[1]:
+        return None
+
+    result = cv2.matchTemplate(haystack, needle, cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, max_loc = cv2.minMaxLoc(result)
+    if max_val < confidence:
+        return None
+    return Box(max_loc[0] + offset_x, max_loc[1] + offset_y, needle_w, needle_h)
+
+
+# Steward preloads ~60 templates x 4 extra scales
+@functools.lru_cache(maxsize=512)
+def _scaled_template(image_path: str, scale: float) -> np.ndarray:
+    """Template resized by `scale`, cached by (path, scale)."""
+    template = load_template(image_path)
+    interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+    return cv2.resize(template, None, fx=scale, fy=scale, interpolation=interpolation)
+
+
+def locate_multiscale(
+    image_path,
+    haystack: np.ndarray = None,
+    confidence: float = 0.8,
+    region=None,
+    scales=(1.0,),
+    pyramid_levels: int = 0,
+):
+    """
+    Find a template that may be rendered at a different size (e.g. after a
+    VDI resolution change).
+
+    The first scale is tried first and returned as soon as it matches; only
+    on a miss are the other scales matched against the same screenshot, and
+    the best-scoring one is returned if it reaches the confidence. With
+    pyramid_levels > 0 the first match is a downscaled coarse search refined
+    at full resolution (see locate_pyramid). Same return value as locate().
+    """
+    if haystack is None:
+        haystack = grab_screen()
+
+    if pyramid_levels > 0:
+        location = locate_pyramid(
+            image_path, haystack, confidence, region, pyramid_levels
+        )
+    else:
+        location = locate(image_path, haystack, confidence, region)
+    if location is not None or len(scales) < 2:
+        return location
+
+    offset_x, offset_y = 0, 0
+    if region:
+        x, y, w, h = region
+        haystack = haystack[y : y + h, x : x + w]
+        offset_x, offset_y = x, y
+
+    best_val, best_box = -1.0, None
+    for scale in scales[1:]:
+        needle = _scaled_template(str(image_path), scale)
+        needle_h, needle_w = needle.shape[:2]
+        if needle_h > haystack.shape[0] or needle_w > haystack.shape[1]:
+            continue
+        result = cv2.matchTemplate(haystack, needle, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        if max_val > best_val:
+            best_val = max_val
+            best_box = Box(
+                max_loc[0] + offset_x, max_loc[1] + offset_y, needle_w, needle_h
+            )
+
+    if best_val < confidence:
+        return None
+    return best_box
+
+
+def pyramid_levels_for(downscale_factor: float) -> int:
+    """
+    Pyramid levels for a downscale factor (0.5 -> 1, 0.25 -> 2); factors
+    that are not a power of two round to the nearest level, 1.0 means none.
+    """
+    if not downscale_factor or downscale_factor >= 1:
+        return 0
+    return max(0, round(math.log2(1 / downscale_factor)))
+
+
+@functools.lru_cache(maxsize=256)
+def _gray_pyramid(image_path: str, levels: int) -> list:
+    """Grayscale template followed by `levels` pyrDown halvings, cached."""
+    pyramid = [cv2.cvtColor(load_template(image_path), cv2.COLOR_BGR2GRAY)]
+    for _ in range(levels):
+        pyramid.append(cv2.pyrDown(pyramid[-1]))
+    return pyramid
+
+
+def locate_pyramid(
+    image_path,
+    haystack: np.ndarray = None,
+    confidence: float = 0.8,
+    region=None,
+    levels: int = 2,
+):
+    """
+    Find a template using a grayscale image pyramid.
+
+    The template is matched on a haystack downsampled by 2**levels, then the
+    coarse hit is refined at full resolution in a small window around it.
+    Same arguments and return value as locate(); the haystack may also be a
+    grayscale capture from grab_screen(gray=True).
+    """
+    if haystack is None:
+        haystack = grab_screen()
+
+    offset_x, offset_y = 0, 0
+    if region:
+        x, y, w, h = region
+        haystack = haystack[y : y + h, x : x + w]
+        offset_x, offset_y = x, y
+
+    if haystack.ndim == 3:
+        haystack = cv2.cvtColor(haystack, cv2.COLOR_BGR2GRAY)
+
+    needles = _gray_pyramid(str(image_path), levels)
+    needle = needles[0]
+    needle_h, needle_w = needle.shape[:2]
+    if needle_h > haystack.shape[0] or needle_w > haystack.shape[1]:
+        return None
+
+    # Use the coarsest level where the template still has usable detail
+    level = levels
+    while level > 0 and min(needles[level].shape[:2]) < MIN_PYRAMID_SIDE:
+        level -= 1
+
+    small = haystack
+    for _ in range(level):
+        small = cv2.pyrDown(small)
+
+    result = cv2.matchTemplate(small, needles[level], cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, (coarse_x, coarse_y) = cv2.minMaxLoc(result)
+
+    if level == 0:
+        if max_val < confidence:
+            return None
+        return Box(coarse_x + offset_x, coarse_y + offset_y, needle_w, needle_h)
+
+    if max_val < confidence - COARSE_SLACK:
+        return None
+
+    # Refine around the coarse hit, padded by one coarse pixel each side
+    scale = 2**level
+    x0 = max(coarse_x * scale - scale, 0)
+    y0 = max(coarse_y * scale - scale, 0)
+    window = haystack[
+        y0 : coarse_y * scale + needle_h + scale,
+        x0 : coarse_x * scale + needle_w + scale,
+    ]
+    if needle_h > window.shape[0] or needle_w > window.shape[1]:
+        return None
+
+    result = cv2.matchTemplate(window, needle, cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, (fine_x, fine_y) = cv2.minMaxLoc(result)
+    if max_val < confidence:
+        return None
+    return Box(x0 + fine_x + offset_x, y0 + fine_y + offset_y, needle_w, needle_h)
+
+
+def shrink_for_ocr(image_b64: str, max_side: int = 2000, quality: int = 85) -> str:
+    """
+    Re-encode a base64 screenshot for OCR upload: grayscale, at most
+    `max_side` px on the long edge, JPEG. Printed EMR text OCRs the same,
+    at a fraction of the upload size.
+
+    Returns the original string if the image cannot be decoded.
+    """
+    raw = np.frombuffer(base64.b64decode(image_b64), np.uint8)
+    image = cv2.imdecode(raw, cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        return image_b64
+
+    long_side = max(image.shape[:2])
+    if long_side > max_side:
+        scale = max_side / long_side
+        image = cv2.resize(
+            image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+        )
+
+    ok, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        return image_b64
+    return base64.b64encode(buffer).decode("ascii")
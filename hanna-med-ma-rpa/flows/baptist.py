@@ -155,7 +155,7 @@ class BaptistFlow(BaseFlow):
         to close any blocking windows until Edge icon is visible.
         """
         logger.info("[FALLBACK L1] Clicking center of screen and closing windows...")
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         center_x, center_y = screen_w // 2, screen_h // 2
 
         max_attempts = 5
@@ -268,7 +268,7 @@ class BaptistBatchInsuranceFlow(BaseFlow):
 
     def _close_patient_detail(self):
         """Close patient detail window (Alt+F4) without navigating to VDI."""
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -416,7 +416,7 @@ class BaptistBatchInsuranceFlow(BaseFlow):
 
         # Click center to ensure focus
         logger.info("[BAPTIST-BATCH-INS] Clicking center to ensure focus...")
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
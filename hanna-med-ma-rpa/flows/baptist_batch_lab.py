@@ -442,7 +442,7 @@ class BaptistBatchLabFlow(BaseFlow):
 
     def _close_patient_detail(self):
         """Close patient detail window (Alt+F4) without navigating to VDI."""
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -466,7 +466,7 @@ class BaptistBatchLabFlow(BaseFlow):
         logger.info("[BAPTIST-BATCH-LAB] Returning to patient list...")
 
         # Click center to re-engage VDI focus (released by Ctrl+Alt during PDF save)
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
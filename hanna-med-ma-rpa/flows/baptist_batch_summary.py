@@ -268,7 +268,7 @@ class BaptistBatchSummaryFlow(BaseBatchSummaryFlow):
 
     def _close_patient_detail(self):
         """Close patient detail window (Alt+F4) without navigating to VDI."""
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -299,7 +299,7 @@ class BaptistBatchSummaryFlow(BaseBatchSummaryFlow):
         if report_element:
             self.safe_click(report_element, "Report Document")
         else:
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(2)
 
@@ -411,7 +411,7 @@ class BaptistBatchSummaryFlow(BaseBatchSummaryFlow):
 
         # Click center to ensure focus
         logger.info("[BAPTIST-BATCH] Clicking center to ensure focus...")
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
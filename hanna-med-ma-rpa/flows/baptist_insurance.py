@@ -413,7 +413,7 @@ class BaptistInsuranceFlow(BaseFlow):
         logger.info("[BAPTIST INSURANCE] Performing cleanup (patient detail open)...")
         try:
             # First close patient detail with Alt+F4
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
             stoppable_sleep(0.5)
 
@@ -430,7 +430,7 @@ class BaptistLabFlow(BaseFlow):
         """Cleanup when patient detail window is open."""
         logger.info("[BAPTIST LAB] Performing cleanup (patient detail open)...")
         try:
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
             stoppable_sleep(0.5)
 
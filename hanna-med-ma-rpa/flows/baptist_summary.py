@@ -278,7 +278,7 @@ class BaptistSummaryFlow(BaseFlow):
         logger.info("[BAPTIST SUMMARY] Performing cleanup (patient detail open)...")
         try:
             # First close patient detail with Alt+F4
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
             stoppable_sleep(0.5)
 
@@ -323,7 +323,7 @@ class BaptistSummaryFlow(BaseFlow):
             logger.warning(
                 "[BAPTIST SUMMARY] Report document image not found, clicking center"
             )
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(2)
 
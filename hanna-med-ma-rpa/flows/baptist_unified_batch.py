@@ -680,7 +680,7 @@ class BaptistUnifiedBatchFlow(BaseFlow):
         if report_element:
             self.safe_click(report_element, "Report Document")
         else:
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(2)
 
@@ -751,7 +751,7 @@ class BaptistUnifiedBatchFlow(BaseFlow):
         logger.info("[BAPTIST-UNIFIED] Navigating to Provider Face Sheet...")
 
         # Click center to re-engage VDI focus
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(1)
 
@@ -874,7 +874,7 @@ class BaptistUnifiedBatchFlow(BaseFlow):
         logger.info("[BAPTIST-UNIFIED] Extracting lab results...")
 
         # Re-engage VDI focus (may have been released by insurance Ctrl+Alt)
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(1)
 
@@ -1053,7 +1053,7 @@ class BaptistUnifiedBatchFlow(BaseFlow):
         self.set_step("RETURN_TO_PATIENT_LIST")
         logger.info("[BAPTIST-UNIFIED] Returning to patient list...")
 
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -1091,7 +1091,7 @@ class BaptistUnifiedBatchFlow(BaseFlow):
 
     def _close_patient_detail(self):
         """Close patient detail window (Alt+F4) — error recovery helper."""
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -1149,6 +1149,8 @@ class BaptistUnifiedBatchFlow(BaseFlow):
         skip_insurance = config.get_rpa_setting("skip_batch_insurance", False)
         skip_lab = config.get_rpa_setting("skip_batch_lab", False)
 
+        items = []
+
         # 1. Summary payload
         if not skip_summaries:
             summary_payload = {
@@ -1161,14 +1163,7 @@ class BaptistUnifiedBatchFlow(BaseFlow):
                 "total": result.get("total", 0),
                 "found_count": result.get("summary_found_count", 0),
             }
-            logger.info("[BAPTIST-UNIFIED] Sending summary results to backend...")
-            resp = self._send_to_summary_webhook_n8n(summary_payload)
-            if resp:
-                logger.info(
-                    f"[BAPTIST-UNIFIED] Summary backend response: {resp.status_code}"
-                )
-            else:
-                logger.error("[BAPTIST-UNIFIED] Failed to send summary to backend")
+            items.append(("patient_summary", summary_payload))
         else:
             logger.info("[BAPTIST-UNIFIED] Summary SKIPPED — not sending to backend")
 
@@ -1184,15 +1179,7 @@ class BaptistUnifiedBatchFlow(BaseFlow):
                 "found_count": result.get("insurance_found_count", 0),
                 "timestamp": datetime.now().strftime("%Y%m%d_%H%M%S"),
             }
-            logger.info("[BAPTIST-UNIFIED] Sending insurance results to backend...")
-            resp = self._send_to_batch_insurance_webhook_n8n(insurance_payload)
-            if resp:
-                logger.info(
-                    f"[BAPTIST-UNIFIED] Insurance backend response: "
-                    f"{resp.status_code}"
-                )
-            else:
-                logger.error("[BAPTIST-UNIFIED] Failed to send insurance to backend")
+            items.append(("patient_insurance", insurance_payload))
         else:
             logger.info("[BAPTIST-UNIFIED] Insurance SKIPPED — not sending to backend")
 
@@ -1208,13 +1195,30 @@ class BaptistUnifiedBatchFlow(BaseFlow):
                 "found_count": result.get("lab_found_count", 0),
                 "timestamp": datetime.now().strftime("%Y%m%d_%H%M%S"),
             }
-            logger.info("[BAPTIST-UNIFIED] Sending lab results to backend...")
-            resp = self._send_to_lab_webhook_n8n(lab_payload)
+            items.append(("patient_lab", lab_payload))
+        else:
+            logger.info("[BAPTIST-UNIFIED] Lab SKIPPED — not sending to backend")
+
+        if not items:
+            return
+
+        # One request for all result sets instead of one per data type
+        logger.info(
+            f"[BAPTIST-UNIFIED] Sending {len(items)} result set(s) to backend..."
+        )
+        responses = self._send_to_backend_ingest_batch(items)
+        labels = {
+            "patient_summary": "Summary",
+            "patient_insurance": "Insurance",
+            "patient_lab": "Lab",
+        }
+        for data_type, resp in responses.items():
+            label = labels[data_type]
             if resp:
                 logger.info(
-                    f"[BAPTIST-UNIFIED] Lab backend response: {resp.status_code}"
+                    f"[BAPTIST-UNIFIED] {label} backend response: {resp.status_code}"
                 )
             else:
-                logger.error("[BAPTIST-UNIFIED] Failed to send lab to backend")
-        else:
-            logger.info("[BAPTIST-UNIFIED] Lab SKIPPED — not sending to backend")
+                logger.error(
+                    f"[BAPTIST-UNIFIED] Failed to send {label.lower()} to backend"
+                )
@@ -3,35 +3,78 @@ Base Flow - Abstract base class for all RPA flows.
 Provides common flow lifecycle and error handling.
 """
 
+import io
 import json
 import os
+import re
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
 
 import pyautogui
 import pydirectinput
-import requests
 
 from config import config
-from core.rpa_engine import RPABotBase, rpa_state, set_should_stop
+from core.http_client import get_http_session
+from core.node_uuid import get_uuid
+from core.rpa_engine import RPABotBase, TaskCancelled, rpa_state, set_should_stop
 from core.system_utils import keep_system_awake, allow_system_sleep
-from core.vdi_input import stoppable_sleep, type_with_clipboard, press_key_vdi
+from core.vision import (
+    grab_screen,
+    locate,
+    locate_pyramid,
+    screen_size,
+    shrink_for_ocr,
+)
+from core.vdi_input import (
+    press_key_vdi,
+    send_hotkey_vdi,
+    stoppable_sleep,
+    type_with_clipboard,
+)
 from logger import logger
 from services.modal_watcher_service import start_modal_watcher, stop_modal_watcher
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib parser
+    orjson = None
 
-def _load_uuid() -> str:
-    """Load UUID from rpa_uuid.json."""
-    uuid_file = Path("rpa_uuid.json")
+# Markdown code fences an LLM may wrap around a JSON answer
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+# Background sender for error reports, so a slow backend doesn't hold up
+# flow teardown. Ingests stay synchronous: their order and status matter.
+_BG_HTTP = ThreadPoolExecutor(max_workers=2, thread_name_prefix="backend-notify")
+
+
+def _log_error_report(future):
+    """Log the outcome of a background error report."""
     try:
-        if uuid_file.exists():
-            data = json.loads(uuid_file.read_text())
-            if "uuid" in data:
-                return data["uuid"]
-    except Exception:
-        pass
-    return "unknown"
+        response = future.result()
+        logger.info(f"[BACKEND] Error notified - Status: {response.status_code}")
+    except Exception as e:
+        logger.error(f"[BACKEND] Failed to notify error: {e}")
+
+
+def _loads(raw):
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _post_json(url: str, body, timeout: float):
+    """POST a JSON body on the shared session (serialized by orjson if available)."""
+    if orjson is None:
+        return get_http_session().post(url, json=body, timeout=timeout)
+    return get_http_session().post(
+        url,
+        data=orjson.dumps(body),
+        headers={"Content-Type": "application/json"},
+        timeout=timeout,
+    )
 
 
 class BaseFlow(RPABotBase, ABC):
@@ -53,6 +96,13 @@ class BaseFlow(RPABotBase, ABC):
         self.doctor_id = None
         self.doctor_name = None
         self.credentials = []  # List of credential dicts
+        self._creds_by_key = {}  # systemKey -> fields, built in setup()
+        # Lazily resolved image paths / search regions, so the detection
+        # retry loops don't re-walk the config on every attempt
+        self._imgs = None
+        self._regions = {}
+        # Error message of the last run() if it failed, else None
+        self.run_error = None
 
     def setup(
         self,
@@ -68,6 +118,8 @@ class BaseFlow(RPABotBase, ABC):
         self.doctor_id = doctor_id
         self.doctor_name = doctor_name
         self.credentials = credentials or []
+        self._creds_by_key = self._index_credentials(self.credentials)
+        self._imgs = self._load_images()
 
         # Update global state
         rpa_state["doctor_id"] = doctor_id
@@ -79,7 +131,18 @@ class BaseFlow(RPABotBase, ABC):
         Get credentials fields for a specific system from the credentials array.
         Returns the fields dict or raises Exception if not found.
         """
-        for cred in self.credentials:
+        try:
+            return self._creds_by_key[system_key]
+        except KeyError:
+            raise Exception(
+                f"Credentials for system '{system_key}' not found in doctor configuration"
+            ) from None
+
+    @staticmethod
+    def _index_credentials(credentials) -> dict:
+        """Map systemKey -> fields (first entry wins) for dicts or Pydantic models."""
+        creds_by_key = {}
+        for cred in credentials:
             # Handle both dict and Pydantic model
             if hasattr(cred, "systemKey"):
                 key = (
@@ -91,13 +154,8 @@ class BaseFlow(RPABotBase, ABC):
             else:
                 key = cred.get("systemKey", "")
                 fields = cred.get("fields", {})
-
-            if key == system_key:
-                return fields
-
-        raise Exception(
-            f"Credentials for system '{system_key}' not found in doctor configuration"
-        )
+            creds_by_key.setdefault(key, fields)
+        return creds_by_key
 
     def teardown(self):
         """Cleanup after flow execution."""
@@ -141,69 +199,117 @@ class BaseFlow(RPABotBase, ABC):
         """
         logger.info("[LOBBY] Verifying lobby screen...")
 
-        # First, check for and dismiss the OK modal if present
-        self._dismiss_ok_modal()
-
-        # Check if we're on the lobby screen
-        lobby_visible = self._check_lobby_visible()
+        # Dismiss a blocking OK modal first, then check for the lobby
+        lobby_visible = self._resolve_lobby_scan(self._scan_lobby())
 
         if not lobby_visible:
             logger.info("[LOBBY] Not on lobby screen - navigating...")
             self._navigate_to_lobby()
 
-            # Wait and verify we arrived
-            stoppable_sleep(5)
-
-            # Check again for OK modal after navigation
-            self._dismiss_ok_modal()
+            # Wait until the lobby (or an OK modal covering it) shows up
+            found = self._poll_until(
+                lambda: self._lobby_scan_hit(self._scan_lobby()),
+                timeout=8,
+                start_interval=0.2,
+                max_interval=1.0,
+            )
 
             # Final verification
-            if not self._check_lobby_visible():
+            if not self._resolve_lobby_scan(found):
                 logger.warning("[LOBBY] Could not verify lobby after navigation")
             else:
                 logger.info("[LOBBY] Successfully navigated to lobby")
         else:
             logger.info("[LOBBY] Already on lobby screen")
 
-    def _check_lobby_visible(self):
-        """Check if lobby screen is visible."""
+    def _scan_lobby(self) -> dict:
+        """Look for the OK modal and the lobby on one screenshot."""
+        return self._scan_screen(
+            {
+                "ok_modal": self._image("ok_modal"),
+                "lobby": self._image("lobby"),
+            }
+        )
+
+    @staticmethod
+    def _lobby_scan_hit(found: dict):
+        """The scan if it saw the lobby or the OK modal, else None."""
+        return found if found["ok_modal"] or found["lobby"] else None
+
+    def _resolve_lobby_scan(self, found) -> bool:
+        """Dismiss the OK modal from a lobby scan if present; True if on the lobby."""
+        if not found:
+            return False
+        if found["ok_modal"]:
+            self._click_ok_modal(found["ok_modal"])
+            # The modal may have hidden the lobby, so look again
+            return self._check_lobby_visible()
+        return found["lobby"] is not None
+
+    def _check_lobby_visible(self, screen=None):
+        """Check if lobby screen is visible (optionally on a given screenshot)."""
         try:
-            location = pyautogui.locateOnScreen(
-                config.get_rpa_setting("images.lobby"), confidence=self.confidence
+            location = locate_pyramid(
+                self._image("lobby"),
+                screen,
+                self.confidence,
+                region=self._get_region("lobby"),
             )
             return location is not None
-        except pyautogui.ImageNotFoundException:
-            return False
         except Exception:
             return False
 
-    def _dismiss_ok_modal(self):
+    def _dismiss_ok_modal(self, screen=None):
         """Dismiss the OK modal if it appears (click twice with delay)."""
         try:
-            ok_modal = pyautogui.locateOnScreen(
-                config.get_rpa_setting("images.ok_modal"), confidence=self.confidence
+            ok_modal = locate_pyramid(
+                self._image("ok_modal"),
+                screen,
+                self.confidence,
+                region=self._get_region("ok_modal"),
             )
             if ok_modal:
-                logger.info("[LOBBY] OK modal detected - dismissing...")
-                center = pyautogui.center(ok_modal)
-                pyautogui.click(center)
-                stoppable_sleep(2)
-                pyautogui.click(center)
-                stoppable_sleep(1)
-                logger.info("[LOBBY] OK modal dismissed")
-        except pyautogui.ImageNotFoundException:
-            pass
+                self._click_ok_modal(ok_modal)
         except Exception as e:
             logger.warning(f"[LOBBY] Error checking OK modal: {e}")
 
+    def _click_ok_modal(self, ok_modal):
+        """Click a detected OK modal twice with delay to dismiss it."""
+        logger.info("[LOBBY] OK modal detected - dismissing...")
+        center = pyautogui.center(ok_modal)
+        pyautogui.click(center)
+        stoppable_sleep(2)
+        pyautogui.click(center)
+        stoppable_sleep(1)
+        logger.info("[LOBBY] OK modal dismissed")
+
+    def _scan_screen(self, images: dict) -> dict:
+        """
+        Look for several images on one screenshot.
+
+        Args:
+            images: Mapping of name -> image path; the name also selects the
+                search region (see _get_region)
+
+        Returns:
+            Mapping of name -> Box, or None where the image was not found
+        """
+        screen = grab_screen(gray=True)
+        found = {}
+        for name, image_path in images.items():
+            try:
+                found[name] = locate_pyramid(
+                    image_path, screen, self.confidence, self._get_region(name)
+                )
+            except Exception as e:
+                logger.warning(f"[{self.EMR_TYPE.upper()}] Error locating {name}: {e}")
+                found[name] = None
+        return found
+
     def _navigate_to_lobby(self):
         """Navigate to the lobby URL using Ctrl+L."""
         # Focus on URL bar with Ctrl+L
-        pydirectinput.keyDown("ctrl")
-        stoppable_sleep(0.2)
-        pydirectinput.press("l")
-        stoppable_sleep(0.2)
-        pydirectinput.keyUp("ctrl")
+        send_hotkey_vdi(("ctrl", "l"))
         stoppable_sleep(1)
 
         # Type the lobby URL
@@ -254,6 +360,7 @@ class BaseFlow(RPABotBase, ABC):
         # Calling it here would try to detect a lobby that isn't open yet.
 
         result = None
+        self.run_error = None
         try:
             result = self.execute()
 
@@ -261,20 +368,29 @@ class BaseFlow(RPABotBase, ABC):
             # (errors are already notified by notify_error() in execute())
             # Note: Baptist returns list of screenshots, summary flows return dict
             has_error = isinstance(result, dict) and result.get("error")
-            if result and not has_error:
+            if has_error:
+                self.run_error = str(result["error"])
+            elif result:
                 self.notify_completion(result)
 
             print("\n" + "=" * 70)
             print(f" {self.FLOW_NAME.upper()} COMPLETED SUCCESSFULLY")
             print("=" * 70 + "\n")
 
+        except TaskCancelled as e:
+            # Reported by the supervisor that cancelled the task
+            print(f"\n[STOP] {self.FLOW_NAME} Cancelled: {e}")
+            self.run_error = f"Cancelled: {e}"
+
         except KeyboardInterrupt:
             print(f"\n[STOP] {self.FLOW_NAME} Stopped by User")
-            self.notify_error("RPA stopped by user")
+            self.run_error = "RPA stopped by user"
+            self.notify_error(self.run_error)
 
         except Exception as e:
             print(f"\n[ERROR] {self.FLOW_NAME} Failed: {e}")
-            self.notify_error(str(e))
+            self.run_error = str(e)
+            self.notify_error(self.run_error)
 
         finally:
             # Stop modal watcher as flow execution is complete
@@ -286,53 +402,58 @@ class BaseFlow(RPABotBase, ABC):
         return result
 
     def notify_error(self, error_message):
-        """Notify backend of an error with screenshot."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_url = None
+        """
+        Notify backend of an error with screenshot.
 
-        # Capture and upload error screenshot
-        try:
-            screenshot_url = self._capture_error_screenshot(timestamp)
-            logger.info(f"[ERROR] Screenshot captured and uploaded: {screenshot_url}")
-        except Exception as screenshot_error:
-            logger.warning(
-                f"[ERROR] Failed to capture error screenshot: {screenshot_error}"
-            )
+        The screen is captured right away; the S3 upload and the backend
+        report then run in the background. Returns the report's Future.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        screenshot = self._capture_error_screenshot(timestamp)
 
         payload = {
-            "uuid": _load_uuid(),
+            "uuid": get_uuid(),
             "hospitalType": self.EMR_TYPE.upper(),
             "error": error_message,
-            "screenshotUrl": screenshot_url,
+            "screenshotUrl": None,
         }
-        try:
-            response = requests.post(
-                f"{self.BACKEND_URL}/rpa/error", json=payload, timeout=15
-            )
-            logger.info(f"[BACKEND] Error notified - Status: {response.status_code}")
-            return response
-        except Exception as e:
-            logger.error(f"[BACKEND] Failed to notify error: {e}")
-            return None
+        future = _BG_HTTP.submit(self._post_error_report, payload, screenshot)
+        future.add_done_callback(_log_error_report)
+        return future
 
     def _capture_error_screenshot(self, timestamp):
-        """Capture screenshot on error and try to upload to S3. Returns URL or None."""
+        """Capture the screen on error. Returns (img_buffer, S3 filename) or None."""
         try:
             from core.s3_client import get_s3_client
 
-            s3_client = get_s3_client()
-            img_buffer = s3_client.take_screenshot()
-
-            failed_step = rpa_state.get("current_step", "unknown_step")
-            filename = f"{self.FLOW_TYPE}/{self.doctor_id or 'unknown'}/error_{failed_step}_{timestamp}.png"
-
-            s3_client.upload_image(img_buffer, filename)
-            screenshot_url = s3_client.generate_presigned_url(filename)
-            return screenshot_url
+            img_buffer = get_s3_client().take_screenshot(fmt="jpeg")
         except Exception as e:
-            logger.warning(f"[ERROR] S3 upload failed for error screenshot: {e}")
+            logger.warning(f"[ERROR] Failed to capture error screenshot: {e}")
             return None
 
+        # Read the step now: teardown clears it before the upload runs
+        failed_step = rpa_state.get("current_step", "unknown_step")
+        filename = f"{self.FLOW_TYPE}/{self.doctor_id or 'unknown'}/error_{failed_step}_{timestamp}.jpg"
+        return img_buffer, filename
+
+    def _post_error_report(self, payload: dict, screenshot):
+        """Upload the error screenshot (if any), then post the error report."""
+        if screenshot:
+            img_buffer, filename = screenshot
+            try:
+                from core.s3_client import get_s3_client
+
+                s3_client = get_s3_client()
+                s3_client.upload_image(img_buffer, filename)
+                payload["screenshotUrl"] = s3_client.generate_presigned_url(filename)
+                logger.info(
+                    f"[ERROR] Screenshot captured and uploaded: {payload['screenshotUrl']}"
+                )
+            except Exception as e:
+                logger.warning(f"[ERROR] S3 upload failed for error screenshot: {e}")
+
+        return _post_json(f"{self.BACKEND_URL}/rpa/error", payload, timeout=15)
+
     # =========================================================================
     # Fullscreen Toggle Methods (EMR-agnostic)
     # =========================================================================
@@ -348,11 +469,8 @@ class BaseFlow(RPABotBase, ABC):
         Returns:
             True if fullscreen mode was confirmed, False otherwise
         """
-        fullscreen_img_key = f"images.{self.EMR_TYPE.lower()}_fullscreen_btn"
-        normalscreen_img_key = f"images.{self.EMR_TYPE.lower()}_normalscreen_btn"
-
-        fullscreen_img = config.get_rpa_setting(fullscreen_img_key)
-        normalscreen_img = config.get_rpa_setting(normalscreen_img_key)
+        fullscreen_img = self._image("fullscreen")
+        normalscreen_img = self._image("normalscreen")
 
         if not fullscreen_img:
             logger.warning(f"[{self.EMR_TYPE.upper()}] Fullscreen image not configured")
@@ -364,10 +482,17 @@ class BaseFlow(RPABotBase, ABC):
             )
             return False
 
+        fullscreen_region = self._get_region("fullscreen_btn")
+        normalscreen_region = self._get_region("normalscreen_btn")
+
         for attempt in range(max_retries):
             try:
-                # Try to click fullscreen button
-                location = pyautogui.locateOnScreen(fullscreen_img, confidence=0.8)
+                # One screenshot serves both the fullscreen and the
+                # already-fullscreen (normalscreen) checks of this attempt
+                screen = grab_screen(gray=True)
+                location = locate_pyramid(
+                    fullscreen_img, screen, 0.8, fullscreen_region
+                )
                 if location:
                     pyautogui.click(pyautogui.center(location))
                     logger.info(
@@ -375,13 +500,13 @@ class BaseFlow(RPABotBase, ABC):
                     )
 
                     # Move mouse to screen center to avoid hover interference
-                    screen_w, screen_h = pyautogui.size()
+                    screen_w, screen_h = self._get_screen_size()
                     pyautogui.moveTo(screen_w // 2, screen_h // 2)
                     stoppable_sleep(2)  # Wait for UI to transition
 
                     # Verify fullscreen by checking if normalscreen button is now visible
-                    normalscreen_location = pyautogui.locateOnScreen(
-                        normalscreen_img, confidence=0.8
+                    normalscreen_location = locate_pyramid(
+                        normalscreen_img, None, 0.8, normalscreen_region
                     )
                     if normalscreen_location:
                         logger.info(
@@ -398,8 +523,8 @@ class BaseFlow(RPABotBase, ABC):
                             continue
                 else:
                     # Check if already in fullscreen (normalscreen visible means already fullscreen)
-                    normalscreen_location = pyautogui.locateOnScreen(
-                        normalscreen_img, confidence=0.8
+                    normalscreen_location = locate_pyramid(
+                        normalscreen_img, screen, 0.8, normalscreen_region
                     )
                     if normalscreen_location:
                         logger.info(
@@ -432,21 +557,22 @@ class BaseFlow(RPABotBase, ABC):
         Click normalscreen button to restore view.
         Uses EMR_TYPE to find the correct image in config.
         """
-        img_key = f"images.{self.EMR_TYPE.lower()}_normalscreen_btn"
-        normalscreen_img = config.get_rpa_setting(img_key)
+        normalscreen_img = self._image("normalscreen")
         if not normalscreen_img:
             logger.warning(
                 f"[{self.EMR_TYPE.upper()}] Normalscreen image not configured"
             )
             return
         try:
-            location = pyautogui.locateOnScreen(normalscreen_img, confidence=0.8)
+            location = locate_pyramid(
+                normalscreen_img, None, 0.8, self._get_region("normalscreen_btn")
+            )
             if location:
                 pyautogui.click(pyautogui.center(location))
                 logger.info(f"[{self.EMR_TYPE.upper()}] Clicked normalscreen button")
 
                 # Move mouse to screen center to avoid hover interference
-                screen_w, screen_h = pyautogui.size()
+                screen_w, screen_h = self._get_screen_size()
                 pyautogui.moveTo(screen_w // 2, screen_h // 2)
                 stoppable_sleep(1)
             else:
@@ -466,7 +592,7 @@ class BaseFlow(RPABotBase, ABC):
         Uses y=1 (title bar area) instead of screen center to avoid
         accidentally clicking buttons, links, or tabs in the EMR.
         """
-        screen_w, _ = pyautogui.size()
+        screen_w, _ = self._get_screen_size()
         pyautogui.click(screen_w // 2, 1)
 
     def _wait_for_patient_list_with_patience(
@@ -512,14 +638,18 @@ class BaseFlow(RPABotBase, ABC):
                 self._focus_window_click()
                 stoppable_sleep(0.5)
 
-                # Try to detect header
-                header_found = self.wait_for_element(
-                    patient_list_header_img,
+                # Try to detect header: fast polling first, then back off
+                header_found = self._poll_until(
+                    lambda: self._find_on_screen(patient_list_header_img),
                     timeout=attempt_timeout,
-                    description=f"Patient List Header ({cycle_name}, attempt {attempt_num}/{max_attempts})",
                 )
 
                 if header_found:
+                    # Let the list finish rendering, confirming the header
+                    # as wait_for_element() does
+                    stoppable_sleep(1)
+                    self._find_on_screen(patient_list_header_img)
+                    stoppable_sleep(1)
                     logger.info(
                         f"[{self.EMR_TYPE.upper()}] Patient List Header detected ({cycle_name}, attempt {attempt_num})"
                     )
@@ -559,6 +689,68 @@ class BaseFlow(RPABotBase, ABC):
 
         return False
 
+    def _poll_until(
+        self, predicate, timeout: float, start_interval=0.1, max_interval=1.0
+    ):
+        """
+        Call `predicate` until it returns a truthy value or `timeout` expires.
+
+        Polls every `start_interval` seconds at first and backs off
+        geometrically to `max_interval`, so quick UI responses are caught
+        fast without busy-polling through long waits.
+
+        Returns:
+            The predicate's last result
+        """
+        deadline = time.monotonic() + timeout
+        interval = start_interval
+        while True:
+            result = predicate()
+            if result:
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return result
+            stoppable_sleep(min(interval, remaining))
+            interval = min(interval * 1.5, max_interval)
+
+    def _find_on_screen(self, image_path, region=None):
+        """Locate an image on screen, treating lookup errors as not found."""
+        try:
+            return locate(image_path, None, self.confidence, region)
+        except Exception as e:
+            logger.warning(f"[{self.EMR_TYPE.upper()}] Error locating image: {e}")
+            return None
+
+    def _load_images(self) -> dict:
+        """Resolve the image paths used by the shared lobby/fullscreen helpers."""
+        emr = self.EMR_TYPE.lower()
+        return {
+            "lobby": config.get_rpa_setting("images.lobby"),
+            "ok_modal": config.get_rpa_setting("images.ok_modal"),
+            "fullscreen": config.get_rpa_setting(f"images.{emr}_fullscreen_btn"),
+            "normalscreen": config.get_rpa_setting(f"images.{emr}_normalscreen_btn"),
+        }
+
+    def _image(self, name: str):
+        """Image path for a shared helper (resolved once per flow)."""
+        if self._imgs is None:
+            self._imgs = self._load_images()
+        return self._imgs[name]
+
+    def _get_screen_size(self) -> tuple:
+        """Screen (width, height), cached for the process."""
+        return screen_size()
+
+    def _get_region(self, name: str):
+        """
+        Search region for a screen element of this EMR, from roi_regions.
+        Returns None (search the whole screen) when not configured.
+        """
+        if name not in self._regions:
+            self._regions[name] = config.get_region(self.EMR_TYPE.lower(), name)
+        return self._regions[name]
+
     def _get_rois(self, agent_name: str = "patient_finder"):
         """
         Load ROI regions for the given agent from config.
@@ -588,17 +780,43 @@ class BaseFlow(RPABotBase, ABC):
     # Screenshot OCR + LLM Patient Extraction
     # =========================================================================
 
-    def _ocr_image_google_vision(self, image_base64: str) -> str:
-        """Send a base64-encoded image to Google Cloud Vision for OCR.
+    # Google Vision accepts at most 16 images per images:annotate call and
+    # caps the JSON request size, so batches are also split by payload size
+    VISION_BATCH_SIZE = 16
+    VISION_BATCH_MAX_CHARS = 8 * 1024 * 1024
+
+    # Patient-extraction system prompt; only the doctor's name varies per call
+    _SYSTEM_PROMPT_HEAD = """You are a medical data extraction expert. Extract the patient list from this OCR text.
+The text may contain data from one or multiple hospitals. Each section is marked with a header:
+--- SOURCE: ... | HOSPITAL: ... ---
+
+For each patient found, extract:
+- name: Patient full name in "LASTNAME, FIRSTNAME" format
+- location: Room/Bed code (if available)
+- reason: Brief reason for visit or diagnosis (if available)
+- admittedDate: Admission date in MM/DD format (if available)
+
+Rules:
+1. Ignore the requesting doctor's name ("""
+    _SYSTEM_PROMPT_TAIL = """) — it is NOT a patient.
+2. Ignore headers, menu items, toolbar text, and any non-patient data.
+3. If a field is not available, use null (not "Unknown" or "N/A").
+4. Return ONLY a valid JSON array, no markdown fences, no extra text.
+5. Format: [{"name":"LASTNAME, FIRSTNAME","location":"code","reason":"text","admittedDate":"MM/DD"}]
+6. If no patients are found, return: []"""
+
+    def _ocr_images_google_vision(self, images_base64: list) -> list:
+        """Send base64-encoded images to Google Cloud Vision for OCR.
+
+        Images are sent together in images:annotate batches, so N screenshots
+        cost one round-trip instead of N.
 
         Args:
-            image_base64: Base64-encoded image data (PNG/JPEG).
+            images_base64: Base64-encoded image data (PNG/JPEG) per image.
 
         Returns:
-            Extracted text from the image.
+            Extracted text per image, in the same order ("" if none).
         """
-        import requests as req
-
         vision_api_key = os.environ.get(
             "GOOGLE_VISION_API_KEY",
             os.environ.get("GOOGLE_API_KEY", ""),
@@ -613,33 +831,59 @@ class BaseFlow(RPABotBase, ABC):
             f"https://vision.googleapis.com/v1/images:annotate" f"?key={vision_api_key}"
         )
 
-        body = {
-            "requests": [
-                {
-                    "image": {"content": image_base64},
-                    "features": [{"type": "DOCUMENT_TEXT_DETECTION"}],
-                    "imageContext": {
-                        "languageHints": ["en", "es"],
-                    },
-                }
-            ]
-        }
+        batches = []
+        for image_base64 in images_base64:
+            if (
+                not batches
+                or len(batches[-1]) >= self.VISION_BATCH_SIZE
+                or sum(map(len, batches[-1])) + len(image_base64)
+                > self.VISION_BATCH_MAX_CHARS
+            ):
+                batches.append([])
+            batches[-1].append(image_base64)
+
+        texts = []
+        for batch in batches:
+            start = len(texts)
+            body = {
+                "requests": [
+                    {
+                        "image": {"content": image_base64},
+                        "features": [{"type": "DOCUMENT_TEXT_DETECTION"}],
+                        "imageContext": {
+                            "languageHints": ["en", "es"],
+                        },
+                    }
+                    for image_base64 in batch
+                ]
+            }
 
-        try:
-            response = req.post(vision_url, json=body, timeout=60)
-            response.raise_for_status()
-            result = response.json()
-        except Exception as e:
-            logger.error(f"[OCR] Google Vision API call failed: {e}")
-            raise Exception(f"Google Vision OCR failed: {e}")
+            try:
+                response = _post_json(vision_url, body, timeout=60)
+                response.raise_for_status()
+                result = response.json()
+            except Exception as e:
+                logger.error(f"[OCR] Google Vision API call failed: {e}")
+                raise Exception(f"Google Vision OCR failed: {e}")
+
+            responses = result.get("responses", [])
+            for idx in range(len(batch)):
+                try:
+                    entry = responses[idx]
+                    if "error" in entry:
+                        logger.error(
+                            f"[OCR] Vision error for image {start + idx + 1}: "
+                            f"{entry['error'].get('message', entry['error'])}"
+                        )
+                        texts.append("")
+                        continue
+                    annotation = entry.get("fullTextAnnotation", {})
+                    texts.append(annotation.get("text", ""))
+                except (KeyError, IndexError) as e:
+                    logger.error(f"[OCR] Failed to parse Vision response: {e}")
+                    texts.append("")
 
-        try:
-            annotation = result["responses"][0].get("fullTextAnnotation", {})
-            text = annotation.get("text", "")
-            return text
-        except (KeyError, IndexError) as e:
-            logger.error(f"[OCR] Failed to parse Vision response: {e}")
-            return ""
+        return texts
 
     def _extract_patients_from_screenshots(self, screenshots: list) -> list:
         """OCR all screenshot images via Google Vision and use Gemini LLM to
@@ -669,8 +913,8 @@ class BaseFlow(RPABotBase, ABC):
             logger.warning("[OCR+LLM] No screenshots provided")
             return []
 
-        # ── Step 1: OCR each screenshot individually ──
-        ocr_segments = []
+        # ── Step 1: OCR all screenshots in one Vision request ──
+        pending = []
         for idx, shot in enumerate(screenshots, 1):
             hospital_ctx = shot.get("hospital_name", f"Hospital_{idx}")
             image_b64 = shot.get("image_b64")
@@ -680,63 +924,63 @@ class BaseFlow(RPABotBase, ABC):
                     f"[OCR+LLM] Screenshot {idx} ({hospital_ctx}) has no image_b64, skipping"
                 )
                 continue
+            pending.append((hospital_ctx, shrink_for_ocr(image_b64)))
 
+        texts = []
+        if pending:
             logger.info(
-                f"[OCR+LLM] OCR screenshot {idx}/{len(screenshots)}: {hospital_ctx}"
+                f"[OCR+LLM] OCR {len(pending)} screenshot(s) via Google Vision"
+            )
+            texts = self._ocr_images_google_vision(
+                [image_b64 for _, image_b64 in pending]
             )
-            extracted_text = self._ocr_image_google_vision(image_b64)
 
+        # Write the segments straight into one buffer: no per-segment copy
+        buf = io.StringIO()
+        segment_count = 0
+        for (hospital_ctx, _), extracted_text in zip(pending, texts):
             if not extracted_text.strip():
                 logger.warning(f"[OCR+LLM] OCR returned empty text for {hospital_ctx}")
                 continue
 
             # Format exactly like n8n: add source/hospital context header
-            segment = (
-                f"--- SOURCE: {self.FLOW_TYPE} | HOSPITAL: {hospital_ctx} ---\n"
-                f"{extracted_text}"
-            )
-            ocr_segments.append(segment)
+            if segment_count:
+                buf.write("\n\n")
+            buf.write("--- SOURCE: ")
+            buf.write(self.FLOW_TYPE)
+            buf.write(" | HOSPITAL: ")
+            buf.write(hospital_ctx)
+            buf.write(" ---\n")
+            buf.write(extracted_text)
+            segment_count += 1
             logger.info(
                 f"[OCR+LLM] OCR {hospital_ctx}: {len(extracted_text)} chars extracted"
             )
 
-        if not ocr_segments:
+        if not segment_count:
             logger.warning("[OCR+LLM] No OCR text extracted from any screenshot")
             return []
 
         # ── Step 2: Combine all OCR texts (like n8n's Aggregate + Format node) ──
-        combined_ocr_text = "\n\n".join(ocr_segments)
+        combined_ocr_text = buf.getvalue()
         logger.info(
             f"[OCR+LLM] Combined OCR text: {len(combined_ocr_text)} chars "
-            f"from {len(ocr_segments)} screenshot(s)"
+            f"from {segment_count} screenshot(s)"
         )
 
         # ── Step 3: Use Gemini LLM to structure the patient data ──
         from agentic.core.llm import create_gemini_model
         from langchain_core.messages import SystemMessage, HumanMessage
-        import json
 
-        llm = create_gemini_model(temperature=0.0)
+        llm = create_gemini_model(
+            temperature=0.0, response_mime_type="application/json"
+        )
         if not llm:
             raise Exception("Failed to initialize Gemini LLM")
 
-        system_prompt = f"""You are a medical data extraction expert. Extract the patient list from this OCR text.
-The text may contain data from one or multiple hospitals. Each section is marked with a header:
---- SOURCE: ... | HOSPITAL: ... ---
-
-For each patient found, extract:
-- name: Patient full name in "LASTNAME, FIRSTNAME" format
-- location: Room/Bed code (if available)
-- reason: Brief reason for visit or diagnosis (if available)
-- admittedDate: Admission date in MM/DD format (if available)
-
-Rules:
-1. Ignore the requesting doctor's name ({self.doctor_name}) — it is NOT a patient.
-2. Ignore headers, menu items, toolbar text, and any non-patient data.
-3. If a field is not available, use null (not "Unknown" or "N/A").
-4. Return ONLY a valid JSON array, no markdown fences, no extra text.
-5. Format: [{{"name":"LASTNAME, FIRSTNAME","location":"code","reason":"text","admittedDate":"MM/DD"}}]
-6. If no patients are found, return: []"""
+        system_prompt = (
+            f"{self._SYSTEM_PROMPT_HEAD}{self.doctor_name}{self._SYSTEM_PROMPT_TAIL}"
+        )
 
         user_prompt = f"OCR TEXT TO PROCESS:\n\n{combined_ocr_text}"
 
@@ -760,15 +1004,8 @@ Rules:
             else:
                 clean_text = str(raw_content).strip()
 
-            if clean_text.startswith("```json"):
-                clean_text = clean_text[7:]
-            if clean_text.startswith("```"):
-                clean_text = clean_text[3:]
-            if clean_text.endswith("```"):
-                clean_text = clean_text[:-3]
-
-            clean_text = clean_text.strip()
-            patients = json.loads(clean_text)
+            clean_text = _FENCE_RE.sub("", clean_text).strip()
+            patients = _loads(clean_text)
 
             if not isinstance(patients, list):
                 raise ValueError("LLM response is not a valid JSON array")
@@ -796,15 +1033,13 @@ Rules:
             payload: The data payload to ingest
         """
         body = {
-            "uuid": _load_uuid(),
+            "uuid": get_uuid(),
             "dataType": data_type,
             "hospitalType": self.EMR_TYPE.upper(),
             "payload": payload,
         }
         try:
-            response = requests.post(
-                f"{self.BACKEND_URL}/rpa/ingest", json=body, timeout=30
-            )
+            response = _post_json(f"{self.BACKEND_URL}/rpa/ingest", body, timeout=30)
             logger.info(
                 f"[BACKEND] Ingest {data_type} sent - Status: {response.status_code}"
             )
@@ -813,6 +1048,64 @@ Rules:
             logger.error(f"[BACKEND] Failed to send ingest {data_type}: {e}")
             return None
 
+    def _send_to_backend_ingest_batch(self, items: list) -> dict:
+        """
+        Send several payloads to the backend in a single ingest request.
+
+        The backend reports a status per item. Items it did not ingest, and
+        every item when the batch request itself fails (non-2xx, e.g. 404
+        from a backend without the batch endpoint or 413, or an exception),
+        are sent again one request each, so one failure never loses the
+        other result sets.
+
+        Args:
+            items: List of (data_type, payload) tuples, ingested in order
+
+        Returns:
+            Dict mapping each data_type to its response (None on failure)
+        """
+        if not items:
+            return {}
+
+        data_types = [data_type for data_type, _ in items]
+        body = {
+            "uuid": get_uuid(),
+            "hospitalType": self.EMR_TYPE.upper(),
+            "items": [
+                {"dataType": data_type, "payload": payload}
+                for data_type, payload in items
+            ],
+        }
+        ingested = set()
+        responses = {}
+        try:
+            response = _post_json(
+                f"{self.BACKEND_URL}/rpa/ingest/batch", body, timeout=60
+            )
+            logger.info(
+                f"[BACKEND] Ingest batch {data_types} sent - "
+                f"Status: {response.status_code}"
+            )
+            if response.ok:
+                for item in _loads(response.content).get("results") or []:
+                    if item.get("success"):
+                        ingested.add(item.get("dataType"))
+                    else:
+                        logger.error(
+                            f"[BACKEND] Batch item {item.get('dataType')} "
+                            f"failed: {item.get('error')}"
+                        )
+                responses = {data_type: response for data_type in ingested}
+        except Exception as e:
+            logger.error(f"[BACKEND] Failed to send ingest batch {data_types}: {e}")
+
+        pending = [item for item in items if item[0] not in ingested]
+        if pending:
+            logger.warning(f"[BACKEND] Sending {[t for t, _ in pending]} one by one")
+        for data_type, payload in pending:
+            responses[data_type] = self._send_to_backend_ingest(data_type, payload)
+        return {data_type: responses[data_type] for data_type in data_types}
+
     def _send_to_list_webhook_n8n(self, data):
         """Send patient list data to the backend (backward-compatible name)."""
         return self._send_to_backend_ingest("patient_list", data)
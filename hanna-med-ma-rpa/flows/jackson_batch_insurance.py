@@ -419,7 +419,7 @@ class JacksonBatchInsuranceFlow(BaseFlow):
 
     def _close_patient_detail(self):
         """Close patient detail window (Alt+F4) without navigating to VDI."""
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -445,7 +445,7 @@ class JacksonBatchInsuranceFlow(BaseFlow):
         logger.info("[JACKSON-BATCH-INS] Returning to patient list...")
 
         # Click center to ensure focus
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -490,7 +490,7 @@ class JacksonBatchInsuranceFlow(BaseFlow):
         self.set_step("CLEANUP")
         logger.info("[JACKSON-BATCH-INS] Cleanup - closing EMR...")
 
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
 
         # Close patient list with Alt+F4
         pyautogui.click(screen_w // 2, screen_h // 2)
@@ -472,7 +472,7 @@ class JacksonBatchLabFlow(BaseFlow):
 
     def _close_patient_detail(self):
         """Close patient detail window (Alt+F4) without navigating to VDI."""
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -495,7 +495,7 @@ class JacksonBatchLabFlow(BaseFlow):
         self.set_step("RETURN_TO_PATIENT_LIST")
         logger.info("[JACKSON-BATCH-LAB] Returning to patient list...")
 
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -539,7 +539,7 @@ class JacksonBatchLabFlow(BaseFlow):
         self.set_step("CLEANUP")
         logger.info("[JACKSON-BATCH-LAB] Cleanup - closing EMR...")
 
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
 
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
@@ -264,7 +264,7 @@ class JacksonBatchSummaryFlow(BaseBatchSummaryFlow):
 
     def _close_patient_detail(self):
         """Close patient detail window (Alt+F4) without navigating to VDI."""
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -301,7 +301,7 @@ class JacksonBatchSummaryFlow(BaseBatchSummaryFlow):
         if report_element:
             self.safe_click(report_element, "Report Document")
         else:
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -346,7 +346,7 @@ class JacksonBatchSummaryFlow(BaseBatchSummaryFlow):
 
         # Click center to ensure focus
         logger.info("[JACKSON-BATCH] Clicking center to ensure focus...")
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -396,7 +396,7 @@ class JacksonBatchSummaryFlow(BaseBatchSummaryFlow):
         self.set_step("CLEANUP")
         logger.info("[JACKSON-BATCH] Cleanup - closing EMR...")
 
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
 
         # If patient detail is still open (last patient), close it first
         if self._patient_detail_open:
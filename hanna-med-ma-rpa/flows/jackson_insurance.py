@@ -415,7 +415,7 @@ class JacksonInsuranceFlow(BaseFlow):
             # For now keeping consistent with summary flow structure
             import pyautogui
 
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
             stoppable_sleep(0.5)
 
@@ -449,7 +449,7 @@ class JacksonInsuranceFlow(BaseFlow):
         try:
             import pyautogui
 
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             patient_list_header_img = config.get_rpa_setting(
                 "images.jackson_patient_list_header"
             )
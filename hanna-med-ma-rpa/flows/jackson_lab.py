@@ -456,7 +456,7 @@ class JacksonLabFlow(BaseFlow):
         """Cleanup when patient not found (only patient list open)."""
         logger.info("[JACKSON LAB] Performing cleanup (patient list only)...")
         try:
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
             stoppable_sleep(0.5)
 
@@ -480,7 +480,7 @@ class JacksonLabFlow(BaseFlow):
         """Cleanup when patient detail is open (2x Alt+F4)."""
         logger.info("[JACKSON LAB] Performing cleanup (patient detail + list)...")
         try:
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             patient_list_header_img = config.get_rpa_setting(
                 "images.jackson_patient_list_header"
             )
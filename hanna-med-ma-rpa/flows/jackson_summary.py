@@ -324,7 +324,7 @@ class JacksonSummaryFlow(BaseFlow):
         logger.info("[JACKSON SUMMARY] Performing cleanup (patient list only)...")
         try:
             # Click on screen center to ensure window has focus
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
             stoppable_sleep(0.5)
 
@@ -357,7 +357,7 @@ class JacksonSummaryFlow(BaseFlow):
         """
         logger.info("[JACKSON SUMMARY] Performing cleanup (patient detail + list)...")
         try:
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             patient_list_header_img = config.get_rpa_setting(
                 "images.jackson_patient_list_header"
             )
@@ -440,14 +440,14 @@ class JacksonSummaryFlow(BaseFlow):
                     "[JACKSON SUMMARY] Could not click report document, trying center screen"
                 )
                 # Fallback: click center of screen
-                screen_w, screen_h = pyautogui.size()
+                screen_w, screen_h = self._get_screen_size()
                 pyautogui.click(screen_w // 2, screen_h // 2)
         else:
             logger.warning(
                 "[JACKSON SUMMARY] Report document image not found, clicking center"
             )
             # Fallback: click center of screen to focus document
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
 
         stoppable_sleep(0.5)
@@ -504,7 +504,7 @@ class JacksonSummaryFlow(BaseFlow):
         logger.info("[JACKSON SUMMARY] Closing patient detail...")
 
         # Click on screen center to ensure window has focus
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         patient_list_header_img = config.get_rpa_setting(
             "images.jackson_patient_list_header"
         )
@@ -1115,6 +1115,8 @@ class JacksonUnifiedBatchFlow(BaseFlow):
         skip_insurance = config.get_rpa_setting("skip_batch_insurance", False)
         skip_lab = config.get_rpa_setting("skip_batch_lab", False)
 
+        items = []
+
         # 1. Summary payload
         if not skip_summaries:
             summary_payload = {
@@ -1127,14 +1129,7 @@ class JacksonUnifiedBatchFlow(BaseFlow):
                 "total": result.get("total", 0),
                 "found_count": result.get("summary_found_count", 0),
             }
-            logger.info("[JACKSON-UNIFIED] Sending summary results to backend...")
-            resp = self._send_to_summary_webhook_n8n(summary_payload)
-            if resp:
-                logger.info(
-                    f"[JACKSON-UNIFIED] Summary backend response: {resp.status_code}"
-                )
-            else:
-                logger.error("[JACKSON-UNIFIED] Failed to send summary to backend")
+            items.append(("patient_summary", summary_payload))
         else:
             logger.info("[JACKSON-UNIFIED] Summary SKIPPED — not sending to backend")
 
@@ -1150,14 +1145,7 @@ class JacksonUnifiedBatchFlow(BaseFlow):
                 "found_count": result.get("insurance_found_count", 0),
                 "timestamp": datetime.now().strftime("%Y%m%d_%H%M%S"),
             }
-            logger.info("[JACKSON-UNIFIED] Sending insurance results to backend...")
-            resp = self._send_to_batch_insurance_webhook_n8n(insurance_payload)
-            if resp:
-                logger.info(
-                    f"[JACKSON-UNIFIED] Insurance backend response: {resp.status_code}"
-                )
-            else:
-                logger.error("[JACKSON-UNIFIED] Failed to send insurance to backend")
+            items.append(("patient_insurance", insurance_payload))
         else:
             logger.info("[JACKSON-UNIFIED] Insurance SKIPPED — not sending to backend")
 
@@ -1173,13 +1161,30 @@ class JacksonUnifiedBatchFlow(BaseFlow):
                 "found_count": result.get("lab_found_count", 0),
                 "timestamp": datetime.now().strftime("%Y%m%d_%H%M%S"),
             }
-            logger.info("[JACKSON-UNIFIED] Sending lab results to backend...")
-            resp = self._send_to_lab_webhook_n8n(lab_payload)
+            items.append(("patient_lab", lab_payload))
+        else:
+            logger.info("[JACKSON-UNIFIED] Lab SKIPPED — not sending to backend")
+
+        if not items:
+            return
+
+        # One request for all result sets instead of one per data type
+        logger.info(
+            f"[JACKSON-UNIFIED] Sending {len(items)} result set(s) to backend..."
+        )
+        responses = self._send_to_backend_ingest_batch(items)
+        labels = {
+            "patient_summary": "Summary",
+            "patient_insurance": "Insurance",
+            "patient_lab": "Lab",
+        }
+        for data_type, resp in responses.items():
+            label = labels[data_type]
             if resp:
                 logger.info(
-                    f"[JACKSON-UNIFIED] Lab backend response: {resp.status_code}"
+                    f"[JACKSON-UNIFIED] {label} backend response: {resp.status_code}"
                 )
             else:
-                logger.error("[JACKSON-UNIFIED] Failed to send lab to backend")
-        else:
-            logger.info("[JACKSON-UNIFIED] Lab SKIPPED — not sending to backend")
+                logger.error(
+                    f"[JACKSON-UNIFIED] Failed to send {label.lower()} to backend"
+                )
@@ -2,20 +2,123 @@
 Steward Health Flow - Patient list recovery for Steward Health System.
 """
 
+import math
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import pyautogui
 import pydirectinput
-import pyperclip
 
 from config import config
+from core.http_client import get_http_session
+from core.latency_stats import get_latency_stats
+from core.ocr_cache import content_hash, get_ocr_cache
 from core.rpa_engine import rpa_state
-from core.vdi_input import type_with_clipboard, press_key_vdi, stoppable_sleep
+from core.vision import (
+    grab_screen,
+    locate_multiscale,
+    preload_templates,
+    screen_size,
+)
+from core.vdi_input import (
+    press_key_vdi,
+    set_clipboard,
+    stoppable_sleep,
+    type_with_clipboard,
+)
 from logger import logger
 
 from .base_flow import BaseFlow
 
+# files:annotate accepts at most 5 pages per PDF
+VISION_MAX_PAGES = 5
+# Every files:annotate request uploads the whole PDF, so the OCR pages are
+# split over at most this many parallel requests: more requests cut wall
+# time, fewer cut upload bytes
+VISION_MAX_REQUESTS = 2
+# Retries of a page OCR request rejected with 429 (rate limited)
+VISION_MAX_RATE_LIMIT_RETRIES = 3
+
+# Share of unprintable / replacement characters above which a PDF text layer
+# is treated as garbled (broken font encoding) and the PDF is OCR'd instead
+GARBLED_CHAR_RATIO = 0.05
+
+# Margin (px) around an element's last position searched before the
+# configured region / full screen
+LAST_HIT_PADDING = 50
+
+# Step 15: how long the Close Meditech button must stay gone before no
+# other Meditech window is assumed to be left (seconds)
+CLOSE_MEDITECH_SETTLE_SECONDS = 1.0
+
+# How long step 5 looks for an already-open session status (seconds)
+STATUS_SESSION_OPEN_WAIT = 2
+
+# Poll interval (s) of primary/fallback tab waits: one screenshot covers
+# both templates, so they can poll faster than a single-element wait
+ANY_ELEMENT_INTERVAL = 0.15
+
+# A page's text layer is trusted without OCR if it has a room-bed number
+# (e.g. "412-01") or at least this many words
+ROOM_BED_PATTERN = re.compile(r"\b\d{3}-\d{2}\b")
+MIN_PAGE_WORDS = 50
+
+# Gemini output schema for the patient list (step 10b), so the response is
+# always a well-formed array of these objects
+PATIENT_LIST_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "location": {"type": "string"},
+            "reason": {"type": "string"},
+            "admittedDate": {"type": "string"},
+        },
+        "required": ["name"],
+    },
+}
+
+
+def _is_garbled(text: str) -> bool:
+    """Heuristic check for text extracted with a broken font mapping."""
+    bad = sum(
+        1
+        for char in text
+        if char == "\ufffd" or not (char.isprintable() or char in "\n\r\t")
+    )
+    return bad / len(text) > GARBLED_CHAR_RATIO
+
+
+def _is_plausible_page(text: str) -> bool:
+    """True if a page's text layer looks like real patient-list text."""
+    if not text.strip() or _is_garbled(text):
+        return False
+    return bool(ROOM_BED_PATTERN.search(text)) or len(text.split()) > MIN_PAGE_WORDS
+
+
+def _vision_pdf_request(pdf_base64: bytes, pages) -> bytes:
+    """
+    files:annotate request body for a base64-encoded PDF.
+
+    The JSON is assembled around the base64 bytes (which need no escaping)
+    instead of decoding them to str and running a multi-MB string through
+    json.dumps. Kept as bytes rather than a streamed generator so the
+    retrying HTTP session can resend it.
+    """
+    return b"".join(
+        (
+            b'{"requests":[{"inputConfig":{"mimeType":"application/pdf","content":"',
+            pdf_base64,
+            b'"},"features":[{"type":"DOCUMENT_TEXT_DETECTION"}],"pages":[',
+            ",".join(str(page) for page in pages).encode("ascii"),
+            b"]}]}",
+        )
+    )
+
 
 class StewardFlow(BaseFlow):
     """RPA flow for Steward Health list recovery."""
@@ -24,24 +127,144 @@ class StewardFlow(BaseFlow):
     FLOW_TYPE = "steward_list_recovery"
     EMR_TYPE = "steward"
 
+    # Also try nearby sizes in case the VDI renders at another resolution
+    TEMPLATE_SCALES = (1.0, 0.75, 0.85, 1.15, 1.25)
+
+    # Saved to the Desktop by the print step
+    PDF_FILENAME = "GOLDEN SUN Portal.pdf"
+    # The print driver is done once the file size holds this long
+    PDF_STABLE_SECONDS = 0.5
+
     def __init__(self):
         super().__init__()
+        # Resolved once per flow: image paths by key without the "steward_"
+        # prefix, and step timeouts by key under "timeouts.steward"
+        self._img = self._load_steward_images()
+        self._to = {
+            key: config.get_timeout(f"steward.{key}")
+            for key in (config.get_rpa_setting("timeouts.steward") or {})
+        }
+        # Optional per-template search regions: roi_regions.steward entries
+        # named like the image keys above
+        self._img_regions = {}
+        for key, image_path in self._img.items():
+            region = self._get_region(key)
+            if region:
+                self._img_regions[image_path] = region
+        # Where each template was last found, see wait_for_element()
+        self._last_hit = {}
+        self._steward_creds = None  # see _get_steward_credentials()
+        self._llm_future = None  # see _start_extraction_warm_up()
+        self._preload_templates()
+
+    def template_region(self, image_path):
+        """Configured search region for a Steward template, if any."""
+        return self._img_regions.get(image_path)
+
+    def wait_for_element(self, image_path, timeout=None, **kwargs):
+        """
+        wait_for_element() with a timeout adapted to how long this element
+        has actually taken to appear in past runs (never above the
+        configured timeout), recording each successful wait. A miss within
+        the adapted timeout keeps waiting up to the configured one before
+        giving up.
+
+        Elements mostly reappear where they were last found, so if one is
+        already showing there, only that small region is searched; otherwise
+        the wait uses the configured region or the full screen as usual.
+        """
+        if timeout is None:
+            timeout = config.get_timeout("default")
+        key = os.path.basename(str(image_path))
+        stats = get_latency_stats()
+        adapted = stats.timeout_for(key, timeout)
+        if adapted < timeout:
+            logger.debug(f"[STEWARD] {key}: adaptive timeout {adapted:.1f}s")
+
+        started = time.monotonic()
+        near_hit = False
+        if kwargs.get("region") is None:
+            near = self._last_hit_region(image_path)
+            if near and self._find_element(image_path, kwargs.get("confidence"), near):
+                kwargs["region"] = near
+                near_hit = True
+        location = super().wait_for_element(image_path, timeout=adapted, **kwargs)
+        if not location and adapted < timeout:
+            # Slower than usual, not necessarily missing: wait out the rest
+            # of the configured timeout (the sample recorded on a hit then
+            # loosens the estimate again), on the usual search area
+            if near_hit:
+                kwargs.pop("region")
+            logger.info(
+                f"[STEWARD] {key}: not found within adaptive {adapted:.1f}s, "
+                f"waiting up to the configured {timeout}s"
+            )
+            location = super().wait_for_element(
+                image_path,
+                timeout=max(timeout - (time.monotonic() - started), 0.1),
+                **kwargs,
+            )
+        if location:
+            stats.record(key, time.monotonic() - started)
+            self._last_hit[image_path] = location
+        return location
+
+    def _last_hit_region(self, image_path):
+        """
+        Search region around where the template was last found, padded by
+        LAST_HIT_PADDING and clipped to the screen, or None.
+        """
+        box = self._last_hit.get(image_path)
+        if box is None:
+            return None
+        screen_w, screen_h = screen_size()
+        x = max(box.left - LAST_HIT_PADDING, 0)
+        y = max(box.top - LAST_HIT_PADDING, 0)
+        right = min(box.left + box.width + LAST_HIT_PADDING, screen_w)
+        bottom = min(box.top + box.height + LAST_HIT_PADDING, screen_h)
+        return (x, y, right - x, bottom - y)
+
+    def _load_steward_images(self):
+        """Resolve every steward_* image path from config."""
+        prefix = "steward_"
+        return {
+            key[len(prefix) :]: config.get_rpa_setting(f"images.{key}")
+            for key, value in (config.get_rpa_setting("images") or {}).items()
+            if key.startswith(prefix) and isinstance(value, str)
+        }
+
+    def _preload_templates(self):
+        """Decode every Steward template once, before the step waits poll them."""
+        missing = preload_templates(
+            self._img.values(), self.TEMPLATE_SCALES, self.pyramid_levels
+        )
+        for image_path in missing:
+            logger.warning(f"[STEWARD] Template image not found: {image_path}")
+
+    def setup(self, *args, **kwargs):
+        """Setup flow context; credentials are re-read on the next login."""
+        super().setup(*args, **kwargs)
+        self._steward_creds = None
+
+    def _get_steward_credentials(self):
+        """Steward email/password, fetched and validated once per setup()."""
+        if self._steward_creds is None:
+            creds = self.get_credentials_for_system("STEWARD")
+            for field in ("email", "password"):
+                if field not in creds:
+                    raise Exception(f"Steward credentials missing '{field}' field")
+            self._steward_creds = creds
+        return self._steward_creds
 
     @property
     def email(self):
         """Get email from Steward credentials."""
-        creds = self.get_credentials_for_system("STEWARD")
-        if "email" not in creds:
-            raise Exception("Steward credentials missing 'email' field")
-        return creds["email"]
+        return self._get_steward_credentials()["email"]
 
     @property
     def password(self):
         """Get password from Steward credentials."""
-        creds = self.get_credentials_for_system("STEWARD")
-        if "password" not in creds:
-            raise Exception("Steward credentials missing 'password' field")
-        return creds["password"]
+        return self._get_steward_credentials()["password"]
 
     def execute(self):
         """Execute all Steward Health flow steps."""
@@ -55,6 +278,8 @@ class StewardFlow(BaseFlow):
         self.step_6_navigate_menu_5()
         self.step_7_navigate_menu_6()
         self.step_8_click_list()
+        # Connect to Vision and build the Gemini client while the PDF prints
+        self._start_extraction_warm_up()
         self.step_9_print_pdf()
         text_content = self.step_10_extract_text_from_pdf()
         structured_patients = self.step_10b_structure_patients_with_llm(text_content)
@@ -70,6 +295,34 @@ class StewardFlow(BaseFlow):
 
         return structured_patients
 
+    def _start_extraction_warm_up(self):
+        """
+        In the background, open a pooled connection to the Vision API (TLS
+        handshake) and create the Gemini model for step 10b, so neither
+        lands on the critical path after the PDF is saved.
+        """
+        pool = ThreadPoolExecutor(max_workers=1)
+        self._llm_future = pool.submit(self._warm_up_extraction)
+        pool.shutdown(wait=False)
+
+    def _warm_up_extraction(self):
+        try:
+            get_http_session().head("https://vision.googleapis.com/", timeout=5)
+        except Exception as e:
+            logger.debug(f"[STEWARD] Vision warm-up failed: {e}")
+        return self._create_patient_llm()
+
+    @staticmethod
+    def _create_patient_llm():
+        """Gemini model for step 10b, bound to the patient list schema."""
+        from agentic.core.llm import create_gemini_model
+
+        return create_gemini_model(
+            temperature=0.0,
+            response_mime_type="application/json",
+            response_schema=PATIENT_LIST_SCHEMA,
+        )
+
     def _log_start(self):
         """Log flow start."""
         logger.info("=" * 80)
@@ -78,7 +331,7 @@ class StewardFlow(BaseFlow):
         logger.info(f"Doctor ID: {self.doctor_id}")
         logger.info(f"Doctor Name: {self.doctor_name}")
         logger.info(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info(f"Screen Resolution: {pyautogui.size()}")
+        logger.info(f"Screen Resolution: {self._get_screen_size()}")
         logger.info("=" * 80)
 
     def notify_completion(self, structured_patients):
@@ -105,8 +358,8 @@ class StewardFlow(BaseFlow):
         logger.info("[STEP 1] Clicking Steward Tab")
 
         steward_tab = self.wait_for_element(
-            config.get_rpa_setting("images.steward_tab"),
-            timeout=config.get_timeout("steward.tab"),
+            self._img["tab"],
+            timeout=self._to["tab"],
             description="Steward Tab",
         )
         if not steward_tab:
@@ -115,7 +368,7 @@ class StewardFlow(BaseFlow):
         if not self.safe_click(steward_tab, "Steward Tab"):
             raise Exception("Failed to click on Steward Tab")
 
-        stoppable_sleep(3)
+        self._wait_for_next_element("favorite", timeout=3)
         logger.info("[STEP 1] Steward Tab clicked")
         return True
 
@@ -125,8 +378,8 @@ class StewardFlow(BaseFlow):
         logger.info("[STEP 2] Clicking Favorite Steward")
 
         favorite = self.wait_for_element(
-            config.get_rpa_setting("images.steward_favorite"),
-            timeout=config.get_timeout("steward.favorite"),
+            self._img["favorite"],
+            timeout=self._to["favorite"],
             description="Favorite Steward",
         )
         if not favorite:
@@ -135,7 +388,7 @@ class StewardFlow(BaseFlow):
         if not self.safe_click(favorite, "Favorite Steward"):
             raise Exception("Failed to click on Favorite Steward")
 
-        stoppable_sleep(3)
+        self._wait_for_next_element("meditech", timeout=3)
         logger.info("[STEP 2] Favorite Steward clicked")
         return True
 
@@ -145,8 +398,8 @@ class StewardFlow(BaseFlow):
         logger.info("[STEP 3] Clicking Meditech")
 
         meditech = self.wait_for_element(
-            config.get_rpa_setting("images.steward_meditech"),
-            timeout=config.get_timeout("steward.meditech"),
+            self._img["meditech"],
+            timeout=self._to["meditech"],
             description="Meditech",
         )
         if not meditech:
@@ -155,7 +408,7 @@ class StewardFlow(BaseFlow):
         if not self.safe_click(meditech, "Meditech"):
             raise Exception("Failed to click on Meditech")
 
-        stoppable_sleep(5)
+        self._wait_for_next_element("login_window", timeout=5)
         logger.info("[STEP 3] Meditech clicked")
         return True
 
@@ -169,8 +422,8 @@ class StewardFlow(BaseFlow):
 
         # --- PHASE 1: LOGIN WINDOW (EMAIL) ---
         login_window = self.wait_for_element(
-            config.get_rpa_setting("images.steward_login_window"),
-            timeout=config.get_timeout("steward.login_window"),
+            self._img["login_window"],
+            timeout=self._to["login_window"],
             description="Login Window",
         )
 
@@ -178,9 +431,7 @@ class StewardFlow(BaseFlow):
             # Recovery attempt with F5
             press_key_vdi("f5")
             stoppable_sleep(5)
-            login_window = self.wait_for_element(
-                config.get_rpa_setting("images.steward_login_window"), timeout=30
-            )
+            login_window = self.wait_for_element(self._img["login_window"], timeout=30)
             if not login_window:
                 raise Exception("Login window not found")
 
@@ -190,7 +441,17 @@ class StewardFlow(BaseFlow):
         stoppable_sleep(1)
 
         logger.info("[LOGIN] Typing Email...")
-        type_with_clipboard(self.email)
+        email = self.email
+        if (
+            config.get_rpa_setting("vdi_us_keyboard_layout", False)
+            and email.isascii()
+            and email.isprintable()
+        ):
+            # Plain keystrokes need none of the clipboard sync waits, but
+            # pydirectinput maps characters such as "@" to US-layout keys
+            pydirectinput.typewrite(email, interval=0.01)
+        else:
+            type_with_clipboard(email)
         stoppable_sleep(1.0)
         press_key_vdi("enter")
 
@@ -199,8 +460,8 @@ class StewardFlow(BaseFlow):
 
         # Wait and locate field BEFORE starting synchronization
         password_window = self.wait_for_element(
-            config.get_rpa_setting("images.steward_password_window"),
-            timeout=config.get_timeout("steward.password_window"),
+            self._img["password_window"],
+            timeout=self._to["password_window"],
             description="Password Input Field",
         )
         if not password_window:
@@ -210,19 +471,21 @@ class StewardFlow(BaseFlow):
         password_click_target = pyautogui.center(password_window)
 
         # --- PHASE 3: COPY PASSWORD (LOCAL) ---
+        # Copied in the background while we focus the field; it must land
+        # before the dance below, which is what pushes it into the VDI
         logger.info("[LOGIN] Copying Password to Local Clipboard...")
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            copied = pool.submit(set_clipboard, self.password)
 
-        pyperclip.copy("")
-        stoppable_sleep(0.5)
-        pyperclip.copy(self.password)
+            # Ensure neutral focus before the dance
+            pyautogui.click(password_click_target)
+            stoppable_sleep(0.5)
+
+            copied.result()
 
         # --- PHASE 4: START MENU TRICK (FORCE SYNC) ---
         logger.info("[LOGIN] Executing Start Menu Dance (Ctrl+Esc) to force sync...")
 
-        # Ensure neutral focus before the dance
-        pyautogui.click(password_click_target)
-        stoppable_sleep(0.5)
-
         # 1. Open Start Menu (Ctrl + Esc)
         pydirectinput.keyDown("ctrl")
         stoppable_sleep(0.1)
@@ -259,7 +522,15 @@ class StewardFlow(BaseFlow):
         logger.info("[LOGIN] Submitting...")
         press_key_vdi("enter")
 
-        stoppable_sleep(8)
+        # Step 5 starts from either the session button or an open-session status
+        session_img = self._img["session_meditech"]
+        status_img = self._img["status_session_open"]
+        self._poll_until(
+            lambda: self._any_element_exists(session_img, status_img),
+            timeout=8,
+            start_interval=0.2,
+            max_interval=1.0,
+        )
         logger.info("[STEP 4] Login sequence completed")
         return True
 
@@ -268,17 +539,23 @@ class StewardFlow(BaseFlow):
         self.set_step("STEP_5_OPEN_SESSION")
         logger.info("[STEP 5] Opening Meditech session")
 
-        # Check if a session is already open (obstacle)
-        if self._check_element_exists(
-            config.get_rpa_setting("images.steward_status_session_open")
+        # Check if a session is already open (obstacle). Step 4 returns as
+        # soon as the session button shows, and the open-session status may
+        # render just after it, so give it a moment.
+        status_img = self._img["status_session_open"]
+        if self._poll_until(
+            lambda: self._check_element_exists(status_img),
+            timeout=STATUS_SESSION_OPEN_WAIT,
+            start_interval=0.2,
+            max_interval=0.5,
         ):
             logger.info("[STEP 5] Session already open - resetting...")
             self._reset_existing_session()
 
         # Now proceed with normal session opening
         session_meditech = self.wait_for_element(
-            config.get_rpa_setting("images.steward_session_meditech"),
-            timeout=config.get_timeout("steward.session"),
+            self._img["session_meditech"],
+            timeout=self._to["session"],
             description="Meditech Session",
         )
         if not session_meditech:
@@ -291,23 +568,44 @@ class StewardFlow(BaseFlow):
         logger.info("[STEP 5] Meditech session opened")
         return True
 
-    def _check_element_exists(self, image_path, confidence=None):
-        """Quickly check if an element exists on screen without waiting."""
+    def _find_element(self, image_path, confidence=None, region=None, haystack=None):
+        """
+        Location of an element on screen right now, or None (no waiting).
+        Pass a grab_screen() `haystack` to match against an existing capture.
+        """
         if confidence is None:
             confidence = self.confidence
+        if region is None:
+            region = self.template_region(image_path)
         try:
-            location = pyautogui.locateOnScreen(image_path, confidence=confidence)
-            return location is not None
-        except pyautogui.ImageNotFoundException:
-            return False
+            return locate_multiscale(
+                image_path,
+                haystack,
+                confidence,
+                region,
+                self.TEMPLATE_SCALES,
+                self.pyramid_levels,
+            )
         except Exception:
-            return False
+            return None
+
+    def _check_element_exists(self, image_path, confidence=None):
+        """Quickly check if an element exists on screen without waiting."""
+        return self._find_element(image_path, confidence) is not None
+
+    def _any_element_exists(self, *image_paths):
+        """True if any of the elements shows in a single screenshot."""
+        screen = grab_screen()
+        return any(
+            self._find_element(image_path, haystack=screen) is not None
+            for image_path in image_paths
+        )
 
     def _reset_existing_session(self):
         """Reset an already-open Meditech session."""
         # Click Reset button
         reset_btn = self.wait_for_element(
-            config.get_rpa_setting("images.steward_reset_session"),
+            self._img["reset_session"],
             timeout=10,
             description="Reset Session Button",
         )
@@ -321,7 +619,7 @@ class StewardFlow(BaseFlow):
 
         # Click Terminate button in the modal
         terminate_btn = self.wait_for_element(
-            config.get_rpa_setting("images.steward_terminate_session"),
+            self._img["terminate_session"],
             timeout=10,
             description="Terminate Session Button",
         )
@@ -346,7 +644,7 @@ class StewardFlow(BaseFlow):
 
         # Close the popup using steward_close_meditech
         close_btn = self.wait_for_element(
-            config.get_rpa_setting("images.steward_close_meditech"),
+            self._img["close_meditech"],
             timeout=10,
             description="Close Meditech (Sign List)",
         )
@@ -366,7 +664,7 @@ class StewardFlow(BaseFlow):
         logger.info("[SIGN LIST] Checking for Warning modal...")
 
         leave_now_btn = self.wait_for_element(
-            config.get_rpa_setting("images.steward_leave_now_btn"),
+            self._img["leave_now_btn"],
             timeout=5,
             description="Leave Now Button",
         )
@@ -397,7 +695,7 @@ class StewardFlow(BaseFlow):
         )
 
         no_btn = self.wait_for_element(
-            config.get_rpa_setting("images.steward_sign_list_no_btn"),
+            self._img["sign_list_no_btn"],
             timeout=5,
             description="Sign List 'No' Button",
         )
@@ -421,19 +719,19 @@ class StewardFlow(BaseFlow):
         - steward_yes_btn_modal_confidential: Confidentiality modal → click 'Yes'
         """
         return {
-            config.get_rpa_setting("images.steward_sign_list_no_btn"): (
+            self._img["sign_list_no_btn"]: (
                 "Sign List Modal (Yes/No)",
                 self._handle_sign_list_modal_no,
             ),
-            config.get_rpa_setting("images.steward_sign_list"): (
+            self._img["sign_list"]: (
                 "Sign List Popup",
                 self._handle_sign_list_popup,
             ),
-            config.get_rpa_setting("images.steward_sign_list_obstacle"): (
+            self._img["sign_list_obstacle"]: (
                 "Sign List Obstacle",
                 self._handle_sign_list_popup,
             ),
-            config.get_rpa_setting("images.steward_yes_btn_modal_confidential"): (
+            self._img["yes_btn_modal_confidential"]: (
                 "Confidentiality Modal",
                 self._handle_confidential_modal,
             ),
@@ -449,7 +747,7 @@ class StewardFlow(BaseFlow):
 
         # Click OK button to dismiss the message
         ok_btn = self.wait_for_element(
-            config.get_rpa_setting("images.steward_message_ok"),
+            self._img["message_ok"],
             timeout=10,
             description="Message OK Button",
         )
@@ -463,7 +761,7 @@ class StewardFlow(BaseFlow):
     def _get_message_handlers(self):
         """Get handlers for informative message popup obstacle."""
         return {
-            config.get_rpa_setting("images.steward_message"): (
+            self._img["message"]: (
                 "Informative Message",
                 self._handle_steward_message,
             ),
@@ -476,10 +774,10 @@ class StewardFlow(BaseFlow):
 
         # Use robust_wait to handle informative message popup if it appears
         menu = self.robust_wait_for_element(
-            config.get_rpa_setting("images.steward_load_menu_5"),
+            self._img["load_menu_5"],
             target_description="Menu (step 5)",
             handlers=self._get_message_handlers(),
-            timeout=config.get_timeout("steward.menu"),
+            timeout=self._to["menu"],
         )
         if not menu:
             raise Exception("Menu (step 5) not found")
@@ -490,7 +788,7 @@ class StewardFlow(BaseFlow):
         press_key_vdi("right")
         press_key_vdi("down")
         press_key_vdi("enter")
-        stoppable_sleep(3)
+        self._wait_for_next_element("load_menu_6", timeout=3)
 
         logger.info("[STEP 6] Menu navigation (step 5) completed")
         return True
@@ -502,10 +800,10 @@ class StewardFlow(BaseFlow):
 
         # Use robust_wait_for_element to handle Sign List popup if it appears
         menu = self.robust_wait_for_element(
-            config.get_rpa_setting("images.steward_load_menu_6"),
+            self._img["load_menu_6"],
             target_description="Menu (step 6)",
             handlers=self._get_sign_list_handlers(),
-            timeout=config.get_timeout("steward.menu"),
+            timeout=self._to["menu"],
         )
         if not menu:
             raise Exception("Menu (step 6) not found")
@@ -518,8 +816,7 @@ class StewardFlow(BaseFlow):
         stoppable_sleep(1)
 
         # 5 times arrow down
-        for _ in range(5):
-            press_key_vdi("down")
+        press_key_vdi("down", presses=5)
 
         press_key_vdi("enter")
         stoppable_sleep(0.5)
@@ -530,18 +827,16 @@ class StewardFlow(BaseFlow):
         stoppable_sleep(0.5)
 
         # 3 tabs
-        for _ in range(3):
-            press_key_vdi("tab")
+        press_key_vdi("tab", presses=3)
 
         press_key_vdi("enter")
         stoppable_sleep(0.5)
 
         # 2 tabs
-        for _ in range(2):
-            press_key_vdi("tab")
+        press_key_vdi("tab", presses=2)
 
         press_key_vdi("enter")
-        stoppable_sleep(3)
+        self._wait_for_next_element("list", timeout=3)
 
         logger.info("[STEP 7] Menu navigation (step 6) completed")
         return True
@@ -552,8 +847,8 @@ class StewardFlow(BaseFlow):
         logger.info("[STEP 8] Clicking on list")
 
         patient_list = self.wait_for_element(
-            config.get_rpa_setting("images.steward_list"),
-            timeout=config.get_timeout("steward.list"),
+            self._img["list"],
+            timeout=self._to["list"],
             description="Patient List",
         )
         if not patient_list:
@@ -572,7 +867,7 @@ class StewardFlow(BaseFlow):
         logger.info("[STEP 9] Printing to PDF (Robust Ctrl+P)")
 
         # 1. Ensure focus on document
-        screen_width, screen_height = pyautogui.size()
+        screen_width, screen_height = self._get_screen_size()
         pyautogui.click(screen_width // 2, screen_height // 2)
         stoppable_sleep(1.5)
 
@@ -589,7 +884,7 @@ class StewardFlow(BaseFlow):
 
         # 3. Wait for print dialog to load
         logger.info("[PRINT] Waiting for Print Dialog...")
-        stoppable_sleep(8.0)
+        self._wait_for_next_element("print_btn", timeout=8)
 
         # 4. Verify Horizon Printer is selected
         if not self._verify_horizon_printer():
@@ -601,7 +896,7 @@ class StewardFlow(BaseFlow):
         # 5. Click Print button to start printing (avoid focus issues with Enter)
         logger.info("[PRINT] Clicking Print button...")
         print_btn = self.wait_for_element(
-            config.get_rpa_setting("images.steward_print_btn"),
+            self._img["print_btn"],
             timeout=10,
             description="Print Button",
         )
@@ -622,25 +917,84 @@ class StewardFlow(BaseFlow):
         stoppable_sleep(1.5)
 
         logger.info("[PRINT] Final Save command...")
+        save_started = time.time()
         press_key_vdi("enter")
 
         logger.info("[PRINT] Waiting for file save...")
-        stoppable_sleep(10.0)
+        if not self._wait_for_pdf_saved(save_started, timeout=15):
+            logger.warning("[PRINT] PDF save not detected within 15s - continuing")
 
         logger.info("[STEP 9] PDF Print sequence finished")
         return True
 
+    def _pdf_path(self):
+        """Path of the list PDF saved by the print step (on the Desktop)."""
+        desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
+        return os.path.join(desktop_path, self.PDF_FILENAME)
+
+    def _wait_for_pdf_saved(self, since, timeout):
+        """
+        Wait until the PDF has been (re)written after `since` and its size has
+        held steady for PDF_STABLE_SECONDS. Returns False on timeout.
+        """
+        pdf_path = self._pdf_path()
+        last_size = [None]
+        stable_since = [None]
+
+        def saved():
+            try:
+                stat = os.stat(pdf_path)
+            except OSError:
+                return False
+            if stat.st_mtime < since or stat.st_size == 0:
+                return False
+            now = time.monotonic()
+            if stat.st_size != last_size[0]:
+                last_size[0] = stat.st_size
+                stable_since[0] = now
+                return False
+            return now - stable_since[0] >= self.PDF_STABLE_SECONDS
+
+        return self._poll_until(
+            saved, timeout=timeout, start_interval=0.1, max_interval=0.25
+        )
+
+    def _wait_for_next_element(self, image_key, timeout):
+        """
+        Wait up to `timeout` seconds for the next step's element to appear,
+        instead of sleeping for the worst case. The next step still does its
+        own (longer) wait_for_element.
+        """
+        image_path = self._img[image_key]
+        self._poll_until(
+            lambda: self._check_element_exists(image_path),
+            timeout=timeout,
+            start_interval=0.2,
+            max_interval=1.0,
+        )
+
+    def _wait_until_gone(self, image_key, timeout):
+        """
+        Wait up to `timeout` seconds for a just-clicked element to disappear.
+        Returns True once it is gone, False if it is still on screen.
+        """
+        image_path = self._img[image_key]
+        return self._poll_until(
+            lambda: not self._check_element_exists(image_path),
+            timeout=timeout,
+            start_interval=0.15,
+            max_interval=0.5,
+        )
+
     def _verify_horizon_printer(self):
         """Check if Horizon Printer is currently selected."""
-        return self._check_element_exists(
-            config.get_rpa_setting("images.steward_horizon_printer_ok")
-        )
+        return self._check_element_exists(self._img["horizon_printer_ok"])
 
     def _select_horizon_printer(self):
         """Select Horizon Printer from the dropdown."""
         # Click on Save PDF dropdown to open options
         save_pdf_dropdown = self.wait_for_element(
-            config.get_rpa_setting("images.steward_save_pdf_dropdown"),
+            self._img["save_pdf_dropdown"],
             timeout=10,
             description="Save PDF Dropdown",
         )
@@ -654,7 +1008,7 @@ class StewardFlow(BaseFlow):
 
         # Select Horizon Printer option
         horizon_option = self.wait_for_element(
-            config.get_rpa_setting("images.steward_horizon_printer_option"),
+            self._img["horizon_printer_option"],
             timeout=10,
             description="Horizon Printer Option",
         )
@@ -668,25 +1022,109 @@ class StewardFlow(BaseFlow):
         logger.info("[PRINT] Horizon Printer selected")
 
     def step_10_extract_text_from_pdf(self):
-        """Extract text from the printed PDF using Google Cloud Vision OCR."""
+        """
+        Extract text from the printed PDF.
+        Pages whose embedded text layer looks usable are taken as-is; only
+        the others (e.g. image-only pages) are sent to Google Cloud Vision OCR.
+        """
         self.set_step("STEP_10_EXTRACT_TEXT")
-        logger.info("[STEP 10] Extracting text from PDF via Google Vision OCR")
+        logger.info("[STEP 10] Extracting text from PDF")
 
-        # Get the desktop path
-        desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
-        pdf_filename = "GOLDEN SUN Portal.pdf"
-        pdf_path = os.path.join(desktop_path, pdf_filename)
+        pdf_path = self._pdf_path()
 
         # Check if file exists
         if not os.path.exists(pdf_path):
             raise Exception(f"PDF file not found at: {pdf_path}")
 
+        page_texts = self._extract_pdf_text_layer(pdf_path)
+        max_requests = VISION_MAX_REQUESTS
+        # Unreadable locally: OCR as many pages as Vision accepts, in one
+        # request since the page count is unknown
+        if not page_texts:
+            page_texts = [""] * VISION_MAX_PAGES
+            max_requests = 1
+        pending = [
+            page
+            for page, page_text in enumerate(page_texts, start=1)
+            if not _is_plausible_page(page_text)
+        ]
+        if not pending:
+            text_content = "\n".join(page_texts)
+            logger.info(
+                f"[STEP 10] Using embedded PDF text ({len(text_content)} chars), "
+                f"skipping OCR"
+            )
+            return text_content
+
+        # Re-runs on a byte-identical PDF reuse the previous result
+        with open(pdf_path, "rb") as f:
+            pdf_key = content_hash(f.read())
+        ocr_cache = get_ocr_cache()
+        text_content = ocr_cache.get("ocr", pdf_key)
+        if text_content:
+            logger.info(f"[STEP 10] Using cached OCR text ({len(text_content)} chars)")
+            return text_content
+
+        ocr_pages = [page for page in pending if page <= VISION_MAX_PAGES]
+        logger.info(
+            f"[STEP 10] {len(page_texts) - len(pending)}/{len(page_texts)} page(s) "
+            f"from the text layer, OCR for page(s) {ocr_pages}"
+        )
+        ocr_texts = self._ocr_pdf_google_vision(pdf_path, ocr_pages, max_requests)
+        for page, page_text in ocr_texts.items():
+            page_texts[page - 1] = page_text
+
+        text_content = "\n".join(
+            page_text for page_text in page_texts if page_text.strip()
+        )
+        if not text_content.strip():
+            raise Exception("Google Vision OCR returned empty text")
+
+        # Only a complete result is cached: a re-run on the same PDF must
+        # not keep returning a shortened list. Pages past the end of the
+        # PDF are expected to be absent when its page count is unknown.
+        missing = [page for page in ocr_pages if page not in ocr_texts]
+        if missing and max_requests > 1:
+            logger.warning(f"[STEP 10] No OCR result for page(s) {missing}")
+        else:
+            ocr_cache.set("ocr", pdf_key, value=text_content)
+        return text_content
+
+    def _extract_pdf_text_layer(self, pdf_path):
+        """
+        Read the PDF's embedded text locally, one string per page.
+        Returns [] if the PDF can't be read locally.
+        """
+        try:
+            import PyPDF2
+        except ImportError:
+            logger.warning("[STEP 10] PyPDF2 not installed - skipping text layer")
+            return []
+
+        try:
+            with open(pdf_path, "rb") as pdf_file:
+                pdf_reader = PyPDF2.PdfReader(pdf_file)
+                return [page.extract_text() or "" for page in pdf_reader.pages]
+        except Exception as e:
+            logger.warning(f"[STEP 10] Could not read PDF text layer: {e}")
+            return []
+
+    def _ocr_pdf_google_vision(
+        self, pdf_path, pages, max_requests=VISION_MAX_REQUESTS
+    ):
+        """
+        OCR the given 1-based PDF pages with Google Cloud Vision.
+        Returns {page: text}; raises if any page fails, so a partial patient
+        list is never taken for the full one.
+        """
         # Read PDF and encode as base64
         import base64
-        import requests as req
+
+        if not pages:
+            return {}
 
         with open(pdf_path, "rb") as f:
-            pdf_base64 = base64.b64encode(f.read()).decode("utf-8")
+            pdf_base64 = base64.b64encode(f.read())
 
         logger.info(
             f"[STEP 10] PDF loaded ({len(pdf_base64)} base64 chars), "
@@ -708,67 +1146,94 @@ class StewardFlow(BaseFlow):
             f"https://vision.googleapis.com/v1/files:annotate" f"?key={vision_api_key}"
         )
 
-        body = {
-            "requests": [
-                {
-                    "inputConfig": {
-                        "content": pdf_base64,
-                        "mimeType": "application/pdf",
-                    },
-                    "features": [{"type": "DOCUMENT_TEXT_DETECTION"}],
-                    "pages": [1, 2, 3, 4, 5],
-                }
+        # Pages split over up to max_requests requests run in parallel, so
+        # OCR wall time is that of the slowest batch rather than the sum
+        batch_size = math.ceil(len(pages) / max(1, max_requests))
+        batches = [
+            pages[i : i + batch_size] for i in range(0, len(pages), batch_size)
+        ]
+        with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+            futures = [
+                pool.submit(self._ocr_pdf_pages, vision_url, pdf_base64, batch)
+                for batch in batches
             ]
-        }
 
-        try:
-            response = req.post(vision_url, json=body, timeout=60)
-            response.raise_for_status()
-            result = response.json()
-        except Exception as e:
-            logger.error(f"[STEP 10] Google Vision API call failed: {e}")
-            raise Exception(f"Google Vision OCR failed: {e}")
-
-        # Extract text from response
-        # Response structure: responses[0].responses[].fullTextAnnotation.text
-        try:
-            pages_responses = result["responses"][0]["responses"]
-            text_parts = []
-            for i, page_resp in enumerate(pages_responses):
-                annotation = page_resp.get("fullTextAnnotation", {})
-                page_text = annotation.get("text", "")
-                if page_text.strip():
-                    text_parts.append(page_text)
-                    logger.debug(
-                        f"[STEP 10] Page {i + 1}: OCR extracted "
-                        f"{len(page_text)} chars"
-                    )
-
-            text_content = "\n".join(text_parts)
-            logger.info(
-                f"[STEP 10] OCR complete: {len(text_content)} chars from "
-                f"{len(pages_responses)} page(s)"
-            )
-        except (KeyError, IndexError) as e:
-            logger.error(f"[STEP 10] Failed to parse Vision response: {e}")
-            raise Exception(f"Failed to parse Google Vision response: {e}")
+        page_texts = {}
+        for batch, future in zip(batches, futures):
+            try:
+                page_texts.update(future.result())
+            except Exception as e:
+                logger.error(f"[STEP 10] Google Vision API call failed: {e}")
+                raise Exception(f"Google Vision OCR failed for page(s) {batch}: {e}")
 
-        if not text_content.strip():
-            raise Exception("Google Vision OCR returned empty text")
+        logger.info(f"[STEP 10] OCR complete for {len(page_texts)} page(s)")
+        return page_texts
 
-        return text_content
+    def _ocr_pdf_pages(self, vision_url, pdf_base64, pages):
+        """
+        OCR some PDF pages in one Vision files:annotate request, honoring 429
+        Retry-After. Returns {page: text}; raises if any page has an error.
+        """
+        body = _vision_pdf_request(pdf_base64, pages)
+        for attempt in range(VISION_MAX_RATE_LIMIT_RETRIES + 1):
+            response = get_http_session().post(
+                vision_url,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=60,
+            )
+            if response.status_code != 429 or attempt == VISION_MAX_RATE_LIMIT_RETRIES:
+                break
+            try:
+                delay = float(response.headers.get("Retry-After", ""))
+            except ValueError:
+                delay = 2**attempt
+            logger.warning(
+                f"[STEP 10] Page(s) {pages}: Vision rate limited, retrying in {delay}s"
+            )
+            stoppable_sleep(delay)
+
+        response.raise_for_status()
+
+        # Response structure: responses[0].responses[].fullTextAnnotation.text,
+        # one entry per page that exists in the PDF
+        page_responses = response.json()["responses"][0]["responses"]
+        page_texts = {}
+        for index, page_resp in enumerate(page_responses):
+            if "error" in page_resp:
+                raise Exception(page_resp["error"].get("message", page_resp["error"]))
+            page = page_resp.get("context", {}).get("pageNumber", pages[index])
+            page_texts[page] = page_resp.get("fullTextAnnotation", {}).get("text", "")
+            logger.debug(
+                f"[STEP 10] Page {page}: OCR extracted {len(page_texts[page])} chars"
+            )
+        return page_texts
 
     def step_10b_structure_patients_with_llm(self, ocr_text: str):
         """Use Gemini LLM to structure the raw OCR text into a JSON array."""
         self.set_step("STEP_10B_STRUCTURE_LLM")
         logger.info("[STEP 10B] Structuring OCR text using Gemini LLM")
 
-        from agentic.core.llm import create_gemini_model
+        cache_key = (content_hash(ocr_text), self.doctor_name)
+        ocr_cache = get_ocr_cache()
+        patients = ocr_cache.get("patients", *cache_key)
+        if patients is not None:
+            logger.info(
+                f"[STEP 10B] Using cached LLM result: {len(patients)} patients found"
+            )
+            return patients
+
         from langchain_core.messages import SystemMessage, HumanMessage
         import json
-        import re
 
-        llm = create_gemini_model(temperature=0.0)
+        llm = None
+        if self._llm_future is not None:
+            try:
+                llm = self._llm_future.result()
+            except Exception as e:
+                logger.warning(f"[STEP 10B] Gemini warm-up failed: {e}")
+        if llm is None:
+            llm = self._create_patient_llm()
         if not llm:
             raise Exception("Failed to initialize Gemini LLM")
 
@@ -789,7 +1254,6 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
             ]
             response = llm.invoke(messages)
 
-            # Limpiar posible markdown en la respuesta
             raw_content = response.content
             if isinstance(raw_content, list):
                 text_parts = []
@@ -802,16 +1266,8 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
             else:
                 clean_text = str(raw_content).strip()
 
-            if clean_text.startswith("```json"):
-                clean_text = clean_text[7:]
-            if clean_text.startswith("```"):
-                clean_text = clean_text[3:]
-            if clean_text.endswith("```"):
-                clean_text = clean_text[:-3]
-
-            clean_text = clean_text.strip()
-
-            # Parsear el JSON
+            # La respuesta sigue PATIENT_LIST_SCHEMA, pero se valida igual
+            # antes de cachearla o enviarla
             patients = json.loads(clean_text)
 
             if not isinstance(patients, list):
@@ -820,6 +1276,7 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
             logger.info(
                 f"[STEP 10B] LLM extraction successful: {len(patients)} patients found"
             )
+            ocr_cache.set("patients", *cache_key, value=patients)
             return patients
 
         except Exception as e:
@@ -834,8 +1291,8 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         logger.info("[STEP 11] Closing PDF tab")
 
         pdf_tab = self.wait_for_element(
-            config.get_rpa_setting("images.steward_tab_pdf"),
-            timeout=config.get_timeout("steward.pdf_tab"),
+            self._img["tab_pdf"],
+            timeout=self._to["pdf_tab"],
             description="PDF Tab",
         )
         if not pdf_tab:
@@ -844,7 +1301,7 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         # Right click on the tab
         center = pyautogui.center(pdf_tab)
         pyautogui.rightClick(center)
-        stoppable_sleep(1)
+        self._wait_for_next_element("close_tab", timeout=1)
 
         logger.info("[STEP 11] PDF tab right-clicked")
         return True
@@ -855,8 +1312,8 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         logger.info("[STEP 12] Closing tab")
 
         close_tab = self.wait_for_element(
-            config.get_rpa_setting("images.steward_close_tab"),
-            timeout=config.get_timeout("steward.close_tab"),
+            self._img["close_tab"],
+            timeout=self._to["close_tab"],
             description="Close Tab",
         )
         if not close_tab:
@@ -865,7 +1322,7 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         if not self.safe_click(close_tab, "Close Tab"):
             raise Exception("Failed to click on Close Tab")
 
-        stoppable_sleep(2)
+        self._wait_for_next_element("close_modal", timeout=2)
         logger.info("[STEP 12] Tab closed")
         return True
 
@@ -875,8 +1332,8 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         logger.info("[STEP 13] Closing modal")
 
         close_modal = self.wait_for_element(
-            config.get_rpa_setting("images.steward_close_modal"),
-            timeout=config.get_timeout("steward.close_modal"),
+            self._img["close_modal"],
+            timeout=self._to["close_modal"],
             description="Close Modal",
         )
         if not close_modal:
@@ -885,7 +1342,7 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         if not self.safe_click(close_modal, "Close Modal"):
             raise Exception("Failed to click on Close Modal")
 
-        stoppable_sleep(2)
+        self._wait_for_next_element("cancel_modal", timeout=2)
         logger.info("[STEP 13] Modal closed")
         return True
 
@@ -895,8 +1352,8 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         logger.info("[STEP 14] Canceling modal")
 
         cancel_modal = self.wait_for_element(
-            config.get_rpa_setting("images.steward_cancel_modal"),
-            timeout=config.get_timeout("steward.cancel_modal"),
+            self._img["cancel_modal"],
+            timeout=self._to["cancel_modal"],
             description="Cancel Modal",
         )
         if not cancel_modal:
@@ -905,7 +1362,7 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         if not self.safe_click(cancel_modal, "Cancel Modal"):
             raise Exception("Failed to click on Cancel Modal")
 
-        stoppable_sleep(2)
+        self._wait_for_next_element("close_meditech", timeout=2)
         logger.info("[STEP 14] Modal canceled")
         return True
 
@@ -916,8 +1373,8 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
 
         # --- Original behavior: find and click twice ---
         close_meditech = self.wait_for_element(
-            config.get_rpa_setting("images.steward_close_meditech"),
-            timeout=config.get_timeout("steward.close_meditech"),
+            self._img["close_meditech"],
+            timeout=self._to["close_meditech"],
             description="Close Meditech",
         )
         if not close_meditech:
@@ -932,22 +1389,17 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         if not self.safe_click(close_meditech, "Close Meditech (second click)"):
             raise Exception("Failed to click on Close Meditech (second click)")
 
-        stoppable_sleep(2)
-
         # --- New: Verification loop - keep clicking while button is still visible ---
         max_extra_clicks = 3
         extra_clicks = 0
 
         while extra_clicks < max_extra_clicks:
-            # Check if close button is still visible (short timeout)
-            still_visible = self.wait_for_element(
-                config.get_rpa_setting("images.steward_close_meditech"),
-                timeout=3,
-                description="Close Meditech (verification)",
-            )
-
+            # Done once the close button goes away and stays away: another
+            # Meditech window may take a moment to surface after one closes
+            if self._wait_until_gone("close_meditech", timeout=3):
+                stoppable_sleep(CLOSE_MEDITECH_SETTLE_SECONDS)
+            still_visible = self._find_element(self._img["close_meditech"])
             if not still_visible:
-                # Button no longer visible, we're done
                 break
 
             # Button still visible, click again
@@ -958,7 +1410,6 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
             self.safe_click(
                 still_visible, f"Close Meditech (extra click {extra_clicks})"
             )
-            stoppable_sleep(1.5)
 
         logger.info("[STEP 15] Meditech closed")
         return True
@@ -968,22 +1419,17 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         self.set_step("STEP_16_TAB_LOGGED_OUT")
         logger.info("[STEP 16] Right clicking on logged out tab")
 
-        # Try primary: logged out tab
-        tab_location = self.wait_for_element(
-            config.get_rpa_setting("images.steward_tab_logged_out"),
-            timeout=config.get_timeout("steward.logged_out_tab"),
-            description="Logged Out Tab",
+        # Primary: logged out tab; fallback: unexpected error tab. Both are
+        # looked for in the same screenshot, the primary winning if both show.
+        found, tab_location = self.wait_for_any_element(
+            [self._img["tab_logged_out"], self._img["tab_unexpected_error"]],
+            timeout=self._to["logged_out_tab"],
+            check_interval=ANY_ELEMENT_INTERVAL,
+            description="Logged Out / Unexpected Error Tab",
         )
-
-        # Fallback: unexpected error tab
-        if not tab_location:
+        if found == 1:
             logger.warning(
-                "[STEP 16] Logged out tab not found, trying unexpected error tab..."
-            )
-            tab_location = self.wait_for_element(
-                config.get_rpa_setting("images.steward_tab_unexpected_error"),
-                timeout=10,
-                description="Unexpected Error Tab",
+                "[STEP 16] Logged out tab not found, using unexpected error tab"
             )
 
         if not tab_location:
@@ -992,7 +1438,7 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         # Right click on the tab
         center = pyautogui.center(tab_location)
         pyautogui.rightClick(center)
-        stoppable_sleep(1)
+        self._wait_for_next_element("close_tab", timeout=1)
 
         logger.info("[STEP 16] Tab right-clicked")
         return True
@@ -1003,8 +1449,8 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         logger.info("[STEP 17] Closing tab (final)")
 
         close_tab = self.wait_for_element(
-            config.get_rpa_setting("images.steward_close_tab"),
-            timeout=config.get_timeout("steward.close_tab"),
+            self._img["close_tab"],
+            timeout=self._to["close_tab"],
             description="Close Tab",
         )
         if not close_tab:
@@ -1013,7 +1459,7 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         if not self.safe_click(close_tab, "Close Tab (final)"):
             raise Exception("Failed to click on Close Tab (final)")
 
-        stoppable_sleep(2)
+        self._wait_until_gone("close_tab", timeout=2)
         logger.info("[STEP 17] Tab closed (final)")
         return True
 
@@ -1023,8 +1469,8 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         logger.info("[STEP 18] Right clicking on URL")
 
         url_field = self.wait_for_element(
-            config.get_rpa_setting("images.steward_url"),
-            timeout=config.get_timeout("steward.url"),
+            self._img["url"],
+            timeout=self._to["url"],
             description="URL Field",
         )
         if not url_field:
@@ -1057,23 +1503,20 @@ Devuelve ÚNICAMENTE un array JSON válido con esta estructura exacta para cada
         self.set_step("STEP_19_VDI_TAB")
         logger.info("[STEP 19] Clicking VDI Desktop Tab")
 
-        # Try primary image
-        vdi_tab = self.wait_for_element(
-            config.get_rpa_setting("images.common_vdi_desktop_tab"),
-            timeout=config.get_timeout("steward.vdi_tab"),
+        # Primary image, or the Apps-view fallback, from the same screenshot
+        found, vdi_tab = self.wait_for_any_element(
+            [
+                config.get_rpa_setting("images.common_vdi_desktop_tab"),
+                config.get_rpa_setting("images.common_vdi_desktop_tab_fallback"),
+            ],
+            timeout=self._to["vdi_tab"],
+            check_interval=ANY_ELEMENT_INTERVAL,
             description="VDI Desktop Tab",
         )
 
-        used_fallback = False
-        # Fallback to alternative image
-        if not vdi_tab:
-            logger.warning("[STEP 19] Primary VDI tab not found, trying fallback...")
-            vdi_tab = self.wait_for_element(
-                config.get_rpa_setting("images.common_vdi_desktop_tab_fallback"),
-                timeout=config.get_timeout("steward.vdi_tab"),
-                description="VDI Desktop Tab (Apps fallback)",
-            )
-            used_fallback = True
+        used_fallback = found == 1
+        if used_fallback:
+            logger.warning("[STEP 19] Primary VDI tab not found, using fallback")
 
         if not vdi_tab:
             raise Exception("VDI Desktop Tab not found (tried primary and fallback)")
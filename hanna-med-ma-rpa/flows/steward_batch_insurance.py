@@ -401,7 +401,7 @@ class StewardBatchInsuranceFlow(BaseFlow):
 
         try:
             # Click somewhere neutral first (as requested)
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
             stoppable_sleep(0.5)
 
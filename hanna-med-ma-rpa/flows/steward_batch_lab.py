@@ -376,7 +376,7 @@ class StewardBatchLabFlow(BaseFlow):
 
         # Step 9: Copy content with Ctrl+A + Ctrl+C
         logger.info("[STEWARD-BATCH-LAB] Step 9: Copying lab content...")
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -537,7 +537,7 @@ class StewardBatchLabFlow(BaseFlow):
         logger.info("[STEWARD-BATCH-LAB] Returning to patient list...")
 
         try:
-            screen_w, screen_h = pyautogui.size()
+            screen_w, screen_h = self._get_screen_size()
             pyautogui.click(screen_w // 2, screen_h // 2)
             stoppable_sleep(0.5)
 
@@ -14,6 +14,7 @@ import pyperclip
 
 from config import config
 from core.vdi_input import stoppable_sleep
+from core.vision import locate
 from logger import logger
 
 from .base_batch_summary import BaseBatchSummaryFlow
@@ -311,7 +312,7 @@ class StewardBatchSummaryFlow(BaseBatchSummaryFlow):
 
         # === Step 4: Click Center + Ctrl+A + Ctrl+C to Copy ===
         logger.info("[STEWARD-BATCH] Clicking center and copying content...")
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -417,14 +418,12 @@ class StewardBatchSummaryFlow(BaseBatchSummaryFlow):
 
         max_clicks = 5
         clicks_done = 0
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
 
         while clicks_done < max_clicks:
             # First check if we're already at the patient list
             try:
-                rounds_visible = pyautogui.locateOnScreen(
-                    rounds_view_image, confidence=0.8
-                )
+                rounds_visible = locate(rounds_view_image, None, 0.8)
                 if rounds_visible:
                     logger.info(
                         "[STEWARD-BATCH] Rounds Patients view visible - back at patient list"
@@ -436,7 +435,7 @@ class StewardBatchSummaryFlow(BaseBatchSummaryFlow):
 
             # Click close button
             try:
-                close_location = pyautogui.locateOnScreen(close_image, confidence=0.8)
+                close_location = locate(close_image, None, 0.8)
                 if close_location:
                     pyautogui.click(pyautogui.center(close_location))
                     clicks_done += 1
@@ -455,7 +454,7 @@ class StewardBatchSummaryFlow(BaseBatchSummaryFlow):
 
         # Final verification
         try:
-            rounds_visible = pyautogui.locateOnScreen(rounds_view_image, confidence=0.8)
+            rounds_visible = locate(rounds_view_image, None, 0.8)
             if rounds_visible:
                 logger.info("[STEWARD-BATCH] Confirmed - back at patient list")
             else:
@@ -374,7 +374,7 @@ class StewardLabFlow(BaseFlow):
 
         # Step 9: Copy content with Ctrl+A + Ctrl+C
         logger.info("[PHASE 3] Step 9: Copying lab results content...")
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -343,7 +343,7 @@ class StewardSummaryFlow(BaseFlow):
 
         # === Step 4: Click Center + Ctrl+A + Ctrl+C to Copy ===
         logger.info("[PHASE 3] Clicking center and copying content...")
-        screen_w, screen_h = pyautogui.size()
+        screen_w, screen_h = self._get_screen_size()
         pyautogui.click(screen_w // 2, screen_h // 2)
         stoppable_sleep(0.5)
 
@@ -3,6 +3,8 @@ Logging system for RPA Agent
 """
 
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 import tempfile
@@ -78,5 +80,37 @@ def setup_logger(name: str = "RPA") -> logging.Logger:
     return logger
 
 
+_queue_listener = None
+
+
+def start_queue_logging(logger: logging.Logger):
+    """
+    Move the logger's handlers behind a QueueHandler so console and file
+    writes happen on a background thread instead of the caller's.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return
+
+    handlers = list(logger.handlers)
+    log_queue = queue.Queue(-1)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+
+def stop_queue_logging():
+    """Flush pending records and stop the background logging thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 # Create default logger
 logger = setup_logger()
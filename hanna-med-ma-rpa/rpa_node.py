@@ -8,47 +8,78 @@ Handles:
 - Batch data sending to the backend ingestion endpoint
 """
 
+import importlib
 import time
 import socket
-import uuid
 import json
 import logging
+import queue
 import threading
-from datetime import datetime
-from pathlib import Path
-
-import requests
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import datetime, timezone
 
+from core.http_client import close_http_session, get_http_session
+from core.node_uuid import get_or_create_uuid
+from core.ocr_cache import get_ocr_cache
 from core.redis_consumer import RedisConsumer
 from core.redis_scheduler import RedisScheduler
+from core.rpa_engine import set_should_stop
+from core.sync_state import get_sync_state_store
 from caretracker.worker import handle_caretracker_task
 from billing.worker import get_billing_worker
 
 from config import config
 
-logger = logging.getLogger(__name__)
-
-# Path to store the UUID persistently
-UUID_FILE = Path("rpa_uuid.json")
-
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib parser
+    orjson = None
 
-def get_or_create_uuid() -> str:
-    """Get the persisted UUID or generate a new one."""
-    try:
-        if UUID_FILE.exists():
-            data = json.loads(UUID_FILE.read_text())
-            if "uuid" in data:
-                return data["uuid"]
-    except Exception:
-        pass
-
-    new_uuid = str(uuid.uuid4())
-    try:
-        UUID_FILE.write_text(json.dumps({"uuid": new_uuid}))
-    except Exception as e:
-        logger.warning(f"Could not persist UUID: {e}")
+logger = logging.getLogger(__name__)
 
-    return new_uuid
+# Pending background backend posts (heartbeats, error reports)
+OUTBOX_MAXSIZE = 1024
+# How long close() waits for the outbox to drain (seconds)
+OUTBOX_FLUSH_TIMEOUT = 30
+
+# After a task times out, how long its flow gets to notice the stop flag
+# and unwind (seconds)
+TASK_CANCEL_GRACE = 60
+
+# Flow classes resolved by _get_flow_class(), keyed by (module, class name)
+_FLOW_CLASS_CACHE: dict[tuple[str, str], type] = {}
+
+
+def _loads(raw):
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _flow_failed(flow) -> bool:
+    """
+    True if the flow's last run() failed. run() catches and reports flow
+    errors itself, so this is the only way a failure reaches _run_task().
+    """
+    if flow.run_error:
+        logger.error(f"{flow.FLOW_NAME} failed: {flow.run_error}")
+        return True
+    return False
+
+
+def _get_flow_class(module_name: str, class_name: str) -> type:
+    """
+    Import a flow module and return its flow class, once per process.
+    Raises ImportError if the module is not available.
+    """
+    key = (module_name, class_name)
+    flow_cls = _FLOW_CLASS_CACHE.get(key)
+    if flow_cls is None:
+        module = importlib.import_module(module_name)
+        flow_cls = _FLOW_CLASS_CACHE[key] = getattr(module, class_name)
+    return flow_cls
 
 
 class RpaNode:
@@ -57,34 +88,121 @@ class RpaNode:
     def __init__(self):
         self.uuid = get_or_create_uuid()
         self.backend_url = config.BACKEND_URL
+        self._hostname = socket.gethostname()
         self.doctor_id = None
         self.doctor_name = None
         self.doctor_specialty = None
         self.credentials = []
+        # Credentials grouped by upper-case systemKey, see _set_credentials()
+        self._creds_by_system: dict[str, list] = {}
+        # EMR types skipped by config, refreshed with each config fetch
+        self._disabled_emr_types: frozenset[str] = frozenset()
         self.hospital_configs = []
         self._redis_consumer = None
         self._redis_thread = None
+        self._billing_consumer = None
+        self._scheduler = None
         # Stores patient names per hospital after patient_list extraction
         # Used to pass to batch summary/insurance flows
         self._last_patient_names: dict[str, list[str]] = {}
         # Cached data status per hospital (refreshed once per extraction cycle)
         self._data_status_cache: dict[str, dict] = {}
+        # Process-wide HTTP session so register, config polls, heartbeats and
+        # the flows' ingests share pooled keep-alive sockets
+        self._http = get_http_session()
+        # Set when a billing task arrives so the idle wait between cycles
+        # wakes immediately instead of polling the billing queue
+        self._wake = threading.Event()
+        # Set by stop() (signal handler) to end the loop at the next safe point
+        self._stop_event = threading.Event()
+        # Set when a timed-out flow never stopped: its worker thread is lost,
+        # so the node shuts down for its supervisor to restart it (app.py)
+        self.flow_worker_stuck = False
+        # Flows run off the main thread so it stays responsive to signals.
+        # One worker only: every flow drives the same desktop session.
+        self._flow_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="rpa-flow"
+        )
+        # Held by every entry point that drives the desktop (extraction
+        # tasks on the flow pool, billing on the main thread); see _ui_slot()
+        self._ui_lock = threading.Lock()
+        # Persists per-doctor sync watermarks across restarts
+        self._sync_state = get_sync_state_store()
+        # Created now so expired cached patient data is swept at startup
+        get_ocr_cache()
+        # Heartbeats and error reports are sent by a background thread so a
+        # slow backend never stalls the extraction loop; see _post_async()
+        self._outbox = queue.Queue(maxsize=OUTBOX_MAXSIZE)
+        self._sender_thread = threading.Thread(
+            target=self._drain_outbox, name="rpa-outbox", daemon=True
+        )
+        self._sender_thread.start()
+
+    def stop(self):
+        """
+        Request a graceful shutdown. Safe to call from a signal handler.
+
+        The running flow is interrupted at its next stoppable sleep, and the
+        extraction loop exits once it has unwound.
+        """
+        self._stop_event.set()
+        set_should_stop(True)
+        self._wake.set()
+
+    def close(self):
+        """Stop background workers and release the shared HTTP session."""
+        for consumer in (self._redis_consumer, self._billing_consumer):
+            if consumer is not None:
+                consumer.stop()
+        if self._scheduler is not None:
+            self._scheduler.stop()
+        self._flow_pool.shutdown(wait=False, cancel_futures=True)
+        self._sync_state.close()
+        # Let queued error reports go out before the session closes
+        self._outbox.put(None)
+        self._sender_thread.join(timeout=OUTBOX_FLUSH_TIMEOUT)
+        close_http_session()
+
+    def _post_async(self, kind: str, send):
+        """
+        Queue `send()` (a backend post) for the outbox thread.
+        Heartbeats are dropped when the outbox is full, since the next one
+        supersedes them; other posts wait briefly for room.
+        """
+        try:
+            if kind == "heartbeat":
+                self._outbox.put_nowait((kind, send))
+            else:
+                self._outbox.put((kind, send), timeout=5)
+        except queue.Full:
+            logger.warning(f"Outbox full, dropping {kind}")
+
+    def _drain_outbox(self):
+        """Outbox thread: run queued posts in order until close()."""
+        while True:
+            item = self._outbox.get()
+            if item is None:
+                return
+            kind, send = item
+            try:
+                send()
+            except Exception as e:
+                logger.warning(f"Background {kind} failed: {e}")
 
     def register(self) -> bool:
         """Register this RPA node with the backend."""
         try:
-            hostname = socket.gethostname()
-            response = requests.post(
+            response = self._http.post(
                 f"{self.backend_url}/rpa/register",
                 json={
                     "uuid": self.uuid,
-                    "hostname": hostname,
+                    "hostname": self._hostname,
                 },
                 timeout=15,
             )
 
             if response.status_code in [200, 201]:
-                data = response.json()
+                data = _loads(response.content)
                 logger.info(f"Registered successfully. UUID: {self.uuid}")
 
                 if data.get("doctorId"):
@@ -117,54 +235,67 @@ class RpaNode:
 
         logger.info("Waiting for admin to assign a doctor to this node...")
         start = time.time()
+        # Poll quickly at first (an assignment often lands within seconds),
+        # backing off so idle nodes don't keep hitting the backend
+        delay = 1.0
+        max_delay = config.get_rpa_setting("assignment_poll_max_seconds", 30)
 
-        while time.time() - start < timeout_seconds:
+        while time.time() - start < timeout_seconds and not self._stop_event.is_set():
             try:
-                response = requests.get(
+                response = self._http.get(
                     f"{self.backend_url}/rpa/{self.uuid}/config",
                     timeout=10,
                 )
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _loads(response.content)
                     if data.get("doctorId"):
                         self.doctor_id = data["doctorId"]
                         self.doctor_name = data.get("doctorName")
                         self.doctor_specialty = data.get("doctorSpecialty")
-                        self.credentials = data.get("credentials", [])
+                        self._set_credentials(data.get("credentials", []))
                         self.hospital_configs = data.get("hospitals", [])
                         return True
             except Exception:
                 pass
-            time.sleep(30)
+            self._stop_event.wait(delay)
+            delay = min(delay * 1.5, max_delay)
 
         return False
 
     def _fetch_config(self):
         """Fetch latest configuration from backend."""
         try:
-            response = requests.get(
+            response = self._http.get(
                 f"{self.backend_url}/rpa/{self.uuid}/config",
                 timeout=10,
             )
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 self.doctor_id = data.get("doctorId")
                 self.doctor_name = data.get("doctorName")
                 self.doctor_specialty = data.get("doctorSpecialty")
-                self.credentials = data.get("credentials", [])
+                self._set_credentials(data.get("credentials", []))
                 self.hospital_configs = data.get("hospitals", [])
         except Exception as e:
             logger.warning(f"Config fetch failed: {e}")
+        self._disabled_emr_types = frozenset(
+            t.upper()
+            for t in (config.get_rpa_setting("disabled_emr_types", []) or [])
+            if isinstance(t, str)
+        )
+
+    def _set_credentials(self, credentials: list):
+        """Store the doctor's credentials and group them by system once."""
+        self.credentials = credentials or []
+        self._creds_by_system = {}
+        for cred in self.credentials:
+            system = cred.get("systemKey", "").upper()
+            self._creds_by_system.setdefault(system, []).append(cred)
 
     def send_heartbeat(self):
-        """Send heartbeat to backend."""
-        try:
-            requests.post(
-                f"{self.backend_url}/rpa/{self.uuid}/heartbeat",
-                timeout=5,
-            )
-        except Exception as e:
-            logger.warning(f"Heartbeat failed: {e}")
+        """Send heartbeat to backend (in the background)."""
+        url = f"{self.backend_url}/rpa/{self.uuid}/heartbeat"
+        self._post_async("heartbeat", lambda: self._http.post(url, timeout=5))
 
     def start_redis_listener(self):
         """Start Redis listeners in background threads."""
@@ -183,8 +314,11 @@ class RpaNode:
         # Billing note search queue (enqueues for processing between cycles)
         self._billing_consumer = RedisConsumer()
         billing_worker = get_billing_worker()
+        def on_billing_task(task_data):
+            billing_worker.enqueue_task(task_data)
+            self._wake.set()
         def run_billing_listener():
-            self._billing_consumer.listen("billing:note-search", billing_worker.enqueue_task)
+            self._billing_consumer.listen("billing:note-search", on_billing_task)
         self._billing_thread = threading.Thread(
             target=run_billing_listener, daemon=True, name="BillingNoteListener"
         )
@@ -213,8 +347,6 @@ class RpaNode:
         Only one flow is ever running at a time. If a task fails,
         we log the error, take a screenshot, then skip to the next hospital.
         """
-        from core.rpa_engine import check_should_stop
-
         logger.info("Starting sequential extraction loop...")
 
         # Per-task skip flags (configurable from rpa_config.json)
@@ -223,46 +355,63 @@ class RpaNode:
         skip_summaries = config.get_rpa_setting("skip_batch_summaries", False)
         skip_insurance = config.get_rpa_setting("skip_batch_insurance", False)
         skip_lab = config.get_rpa_setting("skip_batch_lab", False)
+        sync_interval = config.get_rpa_setting("extraction_interval_seconds", 3600)
+        # Backoff while no hospitals are configured, reset once some are
+        empty_config_max_wait = config.get_rpa_setting("empty_config_max_wait", 60)
+        empty_config_wait = 1.0
 
-        while not check_should_stop():
+        while not self._stop_event.is_set():
             # Refresh config and heartbeat at the start of each cycle
             self._fetch_config()
             self.send_heartbeat()
             self._data_status_cache.clear()
 
             if not self.hospital_configs:
-                logger.info("No hospital configs found. Waiting 60s...")
-                time.sleep(60)
+                logger.info(
+                    f"No hospital configs found. Waiting {empty_config_wait:.0f}s..."
+                )
+                self._stop_event.wait(empty_config_wait)
+                empty_config_wait = min(empty_config_wait * 1.5, empty_config_max_wait)
                 continue
+            empty_config_wait = 1.0
 
-            disabled_emr_types = set(
-                t.upper()
-                for t in (config.get_rpa_setting("disabled_emr_types", []) or [])
-                if isinstance(t, str)
-            )
-            if disabled_emr_types:
+            if self._disabled_emr_types:
                 logger.info(
-                    f"Disabled EMR types (config): {', '.join(sorted(disabled_emr_types))}"
+                    "Disabled EMR types (config): "
+                    f"{', '.join(sorted(self._disabled_emr_types))}"
                 )
 
             logger.info(
                 f"=== CYCLE START — {len(self.hospital_configs)} hospital(s) to process ==="
             )
 
-            for hospital_config in self.hospital_configs:
-                if check_should_stop():
+            last_index = len(self.hospital_configs) - 1
+            for index, hospital_config in enumerate(self.hospital_configs):
+                if self._stop_event.is_set():
                     break
 
                 hospital_type = hospital_config.get("type", "UNKNOWN").upper()
-                if hospital_type in disabled_emr_types:
+                if hospital_type in self._disabled_emr_types:
                     logger.info(
                         f"Skipping {hospital_type} — disabled by config (disabled_emr_types)"
                     )
                     continue
 
+                # Incremental sync: a hospital whose last successful sync is
+                # newer than one interval (e.g. right after a node restart)
+                # is not scraped again until it is actually due.
+                since = self._seconds_since_sync(hospital_type)
+                if since is not None and since < sync_interval:
+                    logger.info(
+                        f"Skipping {hospital_type} — last synced {int(since)}s ago "
+                        f"(interval {sync_interval}s)"
+                    )
+                    continue
+
                 logger.info(
                     f"\n{'─' * 60}\n" f"  HOSPITAL: {hospital_type}\n" f"{'─' * 60}"
                 )
+                hospital_ok = True
 
                 # ──────────────────────────────────────────────────────────
                 # UNIFIED FLOW: single login session (login once → list +
@@ -276,7 +425,7 @@ class RpaNode:
                         and skip_insurance
                         and skip_lab
                     ):
-                        self._run_task(
+                        hospital_ok = self._run_task(
                             name=f"{hospital_type} unified_batch",
                             fn=self._extract_unified_batch,
                             hospital_type=hospital_type,
@@ -302,39 +451,47 @@ class RpaNode:
 
                     # Task 2: Batch Summaries
                     if not skip_summaries:
-                        self._run_task(
+                        if not self._run_task(
                             name=f"{hospital_type} batch_summaries",
                             fn=self._extract_batch_summaries,
                             hospital_type=hospital_type,
                             hospital_config=hospital_config,
                             timeout=task_timeout,
-                        )
+                        ):
+                            hospital_ok = False
 
                     # Task 3: Batch Insurance
                     if not skip_insurance:
-                        self._run_task(
+                        if not self._run_task(
                             name=f"{hospital_type} batch_insurance",
                             fn=self._extract_batch_insurance,
                             hospital_type=hospital_type,
                             hospital_config=hospital_config,
                             timeout=task_timeout,
-                        )
+                        ):
+                            hospital_ok = False
 
                     # Task 4: Batch Lab
                     if not skip_lab:
-                        self._run_task(
+                        if not self._run_task(
                             name=f"{hospital_type} batch_lab",
                             fn=self._extract_batch_lab,
                             hospital_type=hospital_type,
                             hospital_config=hospital_config,
                             timeout=task_timeout,
-                        )
+                        ):
+                            hospital_ok = False
+
+                # Only advance the watermark once every task has completed
+                if hospital_ok:
+                    self._mark_synced(hospital_type)
 
                 logger.info(f"--- {hospital_type} complete ---")
 
                 # Brief pause between hospitals so the UI fully resets
-                if not check_should_stop():
-                    time.sleep(5)
+                # (not needed after the last one)
+                if index < last_index:
+                    self._stop_event.wait(5)
 
             # Process billing note tasks between cycles
             self._process_billing_queue()
@@ -344,15 +501,19 @@ class RpaNode:
             logger.info(
                 f"=== CYCLE COMPLETE — waiting {interval}s before next cycle ==="
             )
-            for _ in range(interval):
-                if check_should_stop():
+            deadline = time.monotonic() + interval
+            while not self._stop_event.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     break
-                # Check for new billing tasks during wait
-                billing_worker = get_billing_worker()
-                if billing_worker.has_pending_tasks():
+                # Block until a billing task arrives, a stop is requested or
+                # the interval elapses (stop() also sets the wake event)
+                if self._wake.wait(timeout=remaining):
+                    self._wake.clear()
+                    if self._stop_event.is_set():
+                        break
                     logger.info("[BILLING] New tasks detected during wait, processing...")
                     self._process_billing_queue()
-                time.sleep(1)
 
     def _run_task(
         self,
@@ -365,12 +526,36 @@ class RpaNode:
         """
         Execute a single extraction task safely.
 
-        Returns True if the task completed without raising, False otherwise.
+        Returns True if the task completed, False if it raised or `fn`
+        returned False (the flow failed and already reported its error).
         This ensures only ONE flow controls the UI at any given time.
+
+        A task still running after `timeout` seconds is cancelled through the
+        RPA stop flag (its next check_stop()/stoppable_sleep() raises) and
+        reported as failed.
         """
+        if self._stop_event.is_set():
+            logger.info(f"[TASK SKIP ] {name}: shutdown requested")
+            return False
+
+        def run():
+            with self._ui_slot(name) as acquired:
+                if not acquired:
+                    return False
+                return fn(hospital_type, hospital_config)
+
         logger.info(f"[TASK START] {name}")
         try:
-            fn(hospital_type, hospital_config)
+            future = self._flow_pool.submit(run)
+            deadline = time.monotonic() + timeout
+            # Wait in short slices: an untimed wait cannot be interrupted
+            # by Ctrl+C on Windows.
+            while not wait([future], timeout=1.0).done:
+                if time.monotonic() >= deadline:
+                    return self._cancel_task(name, future, hospital_type, timeout)
+            if future.result() is False:
+                logger.error(f"[TASK FAIL ] {name}: flow reported an error")
+                return False
             logger.info(f"[TASK DONE ] {name}")
             return True
         except Exception as e:
@@ -378,6 +563,50 @@ class RpaNode:
             self._report_error(hospital_type, str(e))
             return False
 
+    def _cancel_task(self, name: str, future, hospital_type: str, timeout) -> bool:
+        """Stop a task that ran past its timeout; always returns False."""
+        logger.error(f"[TASK TIMEOUT] {name}: still running after {timeout}s")
+        # With a reason the flow raises TaskCancelled and leaves the error
+        # report to this method
+        set_should_stop(True, reason=f"{name} timed out after {timeout}s")
+        self._report_error(hospital_type, f"{name} timed out after {timeout}s")
+        if not wait([future], timeout=TASK_CANCEL_GRACE).done:
+            # Stuck outside any stop check (e.g. in native code): the only
+            # flow worker and the desktop lock are lost, so every later task
+            # would just time out behind it. Shut down instead.
+            logger.critical(
+                f"[TASK TIMEOUT] {name}: did not stop within {TASK_CANCEL_GRACE}s, "
+                "shutting the node down for a restart"
+            )
+            self.flow_worker_stuck = True
+            self._stop_event.set()
+            self._wake.set()
+        return False
+
+    @contextmanager
+    def _ui_slot(self, name: str):
+        """
+        Hold the desktop while a flow runs, logging any contention.
+
+        Yields True once the desktop is held, or False (without it) if a
+        stop is requested while waiting, e.g. behind a timed-out flow that
+        never let go. The wait is sliced so the main thread stays
+        responsive to signals.
+        """
+        start = time.monotonic()
+        while not self._ui_lock.acquire(timeout=1.0):
+            if self._stop_event.is_set():
+                logger.warning(f"[UI LOCK] {name} gave up waiting: shutdown requested")
+                yield False
+                return
+        waited = time.monotonic() - start
+        if waited >= 1.0:
+            logger.warning(f"[UI LOCK] {name} waited {waited:.1f}s for the desktop")
+        try:
+            yield True
+        finally:
+            self._ui_lock.release()
+
     def _extract_patient_list(self, hospital_type: str, hospital_config: dict):
         """
         Extract patient list (census) from a single EMR system.
@@ -400,10 +629,7 @@ class RpaNode:
         module_name, class_name = mapping
         logger.info(f"Extracting patient list from {hospital_type}...")
 
-        import importlib
-
-        module = importlib.import_module(module_name)
-        flow_cls = getattr(module, class_name)
+        flow_cls = _get_flow_class(module_name, class_name)
         flow = flow_cls()
 
         creds = self._get_credentials_for(hospital_type)
@@ -413,6 +639,8 @@ class RpaNode:
             credentials=creds,
             doctor_specialty=self.doctor_specialty,
         )
+        if _flow_failed(flow):
+            return False
 
         # Extract patient names from the result for use in batch flows.
         # notify_completion() inside run() already sent data to the backend.
@@ -471,6 +699,8 @@ class RpaNode:
             hospital_type=hospital_type,
             data_status=data_status,
         )
+        if _flow_failed(flow):
+            return False
 
         if result and isinstance(result, dict):
             census_count = len(result.get("structured_patients", []))
@@ -534,18 +764,15 @@ class RpaNode:
             logger.warning(f"No batch summary flow for hospital type: {hospital_type}")
             return
 
-        import importlib
-
         module_name, class_name = mapping
         try:
-            module = importlib.import_module(module_name)
+            flow_cls = _get_flow_class(module_name, class_name)
         except ImportError:
             logger.warning(
                 f"Batch summary flow module not available for {hospital_type}"
             )
             return
 
-        flow_cls = getattr(module, class_name)
         flow = flow_cls()
         creds = self._get_credentials_for(hospital_type)
 
@@ -558,6 +785,8 @@ class RpaNode:
             patient_names=patient_names,
             hospital_type=hospital_type,
         )
+        if _flow_failed(flow):
+            return False
 
         # notify_completion() inside run() already sent data to the backend
         if result:
@@ -615,18 +844,15 @@ class RpaNode:
             )
             return
 
-        import importlib
-
         module_name, class_name = mapping
         try:
-            module = importlib.import_module(module_name)
+            flow_cls = _get_flow_class(module_name, class_name)
         except ImportError:
             logger.warning(
                 f"Batch insurance flow module not available for {hospital_type}"
             )
             return
 
-        flow_cls = getattr(module, class_name)
         flow = flow_cls()
         creds = self._get_credentials_for(hospital_type)
 
@@ -639,6 +865,8 @@ class RpaNode:
             patient_names=patient_names,
             hospital_type=hospital_type,
         )
+        if _flow_failed(flow):
+            return False
 
         # notify_completion() inside run() already sent data to the backend
         if result:
@@ -694,16 +922,13 @@ class RpaNode:
             logger.warning(f"No batch lab flow for hospital type: {hospital_type}")
             return
 
-        import importlib
-
         module_name, class_name = mapping
         try:
-            module = importlib.import_module(module_name)
+            flow_cls = _get_flow_class(module_name, class_name)
         except ImportError:
             logger.warning(f"Batch lab flow module not available for {hospital_type}")
             return
 
-        flow_cls = getattr(module, class_name)
         flow = flow_cls()
         creds = self._get_credentials_for(hospital_type)
 
@@ -716,6 +941,8 @@ class RpaNode:
             patient_names=patient_names,
             hospital_type=hospital_type,
         )
+        if _flow_failed(flow):
+            return False
 
         # notify_completion() inside run() already sent data to the backend
         if result:
@@ -731,35 +958,35 @@ class RpaNode:
                 f"Batch lab flow for {hospital_type} completed (no return data)"
             )
 
+    def _seconds_since_sync(self, hospital_type: str):
+        """
+        Seconds since the last successful sync of a hospital for the current
+        doctor, or None when there is no usable watermark (full sync).
+        """
+        state = self._sync_state.get_watermarks(self.doctor_id)
+        last_modified = (state.get(hospital_type) or {}).get("last_modified")
+        if not last_modified:
+            return None
+        try:
+            last = datetime.fromisoformat(last_modified)
+        except (TypeError, ValueError):
+            return None
+        if last.tzinfo is None:
+            # Local-time watermark without an offset: not comparable, resync
+            return None
+        return (datetime.now(timezone.utc) - last).total_seconds()
+
+    def _mark_synced(self, hospital_type: str):
+        """Advance the sync watermark of a hospital after a successful run."""
+        self._sync_state.upsert_watermark(
+            self.doctor_id,
+            hospital_type,
+            datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        )
+
     def _get_credentials_for(self, hospital_type: str) -> list:
         """Get credentials for a specific hospital type."""
-        return [
-            c
-            for c in self.credentials
-            if c.get("systemKey", "").upper() == hospital_type.upper()
-        ]
-
-    def _send_to_backend(self, data_type: str, hospital_type: str, payload: dict):
-        """Send extracted data to the backend ingestion endpoint."""
-        try:
-            response = requests.post(
-                f"{self.backend_url}/rpa/ingest",
-                json={
-                    "uuid": self.uuid,
-                    "dataType": data_type,
-                    "hospitalType": hospital_type,
-                    "payload": payload,
-                },
-                timeout=30,
-            )
-            if response.status_code in [200, 201]:
-                logger.info(f"Data sent: {data_type} for {hospital_type}")
-            else:
-                logger.error(
-                    f"Backend rejected: {response.status_code} — {response.text}"
-                )
-        except Exception as e:
-            logger.error(f"Send error: {e}")
+        return self._creds_by_system.get(hospital_type.upper(), [])
 
     def _process_billing_queue(self):
         """Process pending billing note search tasks between extraction cycles."""
@@ -772,11 +999,12 @@ class RpaNode:
         logger.info(f"[BILLING] Processing {pending} pending note search task(s)...")
 
         while billing_worker.has_pending_tasks():
-            from core.rpa_engine import check_should_stop
-
-            if check_should_stop():
+            if self._stop_event.is_set():
                 break
-            billing_worker.process_next_task()
+            with self._ui_slot("billing note search") as acquired:
+                if not acquired:
+                    break
+                billing_worker.process_next_task()
 
         logger.info("[BILLING] Billing queue processing complete.")
 
@@ -789,13 +1017,13 @@ class RpaNode:
             return self._data_status_cache[hospital_type]
 
         try:
-            response = requests.get(
+            response = self._http.get(
                 f"{self.backend_url}/rpa/{self.uuid}/patients/data-status",
                 params={"emrSystem": hospital_type},
                 timeout=15,
             )
             if response.status_code == 200:
-                status = response.json()
+                status = _loads(response.content)
                 logger.info(
                     f"[SMART] Data status received for {len(status)} patients in {hospital_type}"
                 )
@@ -892,30 +1120,43 @@ class RpaNode:
         return flags
 
     def _report_error(self, hospital_type: str, error_message: str):
-        """Report an error to the backend."""
+        """
+        Report an error to the backend. The screenshot is taken right away
+        (while the error is on screen); upload and post happen in the
+        background.
+        """
+        s3 = img_buffer = None
         try:
+            from core.s3_client import get_s3_client
+
+            s3 = get_s3_client()
+            img_buffer = s3.take_screenshot(fmt="jpeg")
+        except Exception:
+            pass
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        def send():
             screenshot_url = None
+            if img_buffer is not None:
+                try:
+                    filename = f"errors/{self.uuid}/{hospital_type}_{timestamp}.jpg"
+                    s3.upload_image(img_buffer, filename)
+                    screenshot_url = s3.generate_presigned_url(filename)
+                except Exception:
+                    pass
+
             try:
-                from core.s3_client import get_s3_client
-
-                s3 = get_s3_client()
-                img_buffer = s3.take_screenshot()
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"errors/{self.uuid}/{hospital_type}_{timestamp}.png"
-                s3.upload_image(img_buffer, filename)
-                screenshot_url = s3.generate_presigned_url(filename)
+                self._http.post(
+                    f"{self.backend_url}/rpa/error",
+                    json={
+                        "uuid": self.uuid,
+                        "hospitalType": hospital_type,
+                        "error": error_message,
+                        "screenshotUrl": screenshot_url,
+                    },
+                    timeout=10,
+                )
             except Exception:
                 pass
 
-            requests.post(
-                f"{self.backend_url}/rpa/error",
-                json={
-                    "uuid": self.uuid,
-                    "hospitalType": hospital_type,
-                    "error": error_message,
-                    "screenshotUrl": screenshot_url,
-                },
-                timeout=10,
-            )
-        except Exception:
-            pass
+        self._post_async("error", send)
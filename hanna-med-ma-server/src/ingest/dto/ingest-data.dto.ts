@@ -43,6 +43,38 @@ export class IngestDataDto {
   payload: any;
 }
 
+export class IngestBatchItemDto {
+  @ApiProperty({
+    enum: IngestDataType,
+    description: "Type of data being ingested",
+  })
+  @IsEnum(IngestDataType)
+  dataType: IngestDataType;
+
+  @ApiProperty({ description: "Payload containing extracted data" })
+  @IsObject()
+  payload: any;
+}
+
+export class IngestBatchDto {
+  @ApiProperty({ example: "a1b2c3-uuid", description: "RPA node UUID" })
+  @IsString()
+  uuid: string;
+
+  @ApiProperty({ enum: HospitalType, description: "Hospital EMR system" })
+  @IsEnum(HospitalType)
+  hospitalType: HospitalType;
+
+  @ApiProperty({
+    type: [IngestBatchItemDto],
+    description: "Payloads to ingest, processed in order",
+  })
+  @IsArray()
+  @ValidateNested({ each: true })
+  @Type(() => IngestBatchItemDto)
+  items: IngestBatchItemDto[];
+}
+
 export class IngestErrorDto {
   @ApiProperty({ description: "RPA node UUID" })
   @IsString()
@@ -20,7 +20,11 @@ import {
   ApiQuery,
 } from "@nestjs/swagger";
 import { IngestService } from "./ingest.service";
-import { IngestDataDto, IngestErrorDto } from "./dto/ingest-data.dto";
+import {
+  IngestBatchDto,
+  IngestDataDto,
+  IngestErrorDto,
+} from "./dto/ingest-data.dto";
 import { JwtAuthGuard } from "../auth/guards/jwt-auth.guard";
 
 @ApiTags("RPA Ingestion")
@@ -42,6 +46,24 @@ export class IngestController {
     return { success: true, message: `Data ingested: ${dto.dataType}`, result };
   }
 
+  @Post("ingest/batch")
+  @ApiOperation({ summary: "Ingest several payloads from RPA node at once" })
+  @ApiBody({ type: IngestBatchDto })
+  @ApiResponse({ status: 201, description: "Data ingested successfully" })
+  async ingestBatch(@Body() dto: IngestBatchDto) {
+    const dataTypes = dto.items.map((item) => item.dataType).join(", ");
+    this.logger.log(
+      `Ingest batch: [${dataTypes}] from ${dto.hospitalType} (UUID: ${dto.uuid})`,
+    );
+    const results = await this.ingestService.processIngestBatch(dto);
+    const ingested = results.filter((item) => item.success).length;
+    return {
+      success: ingested === results.length,
+      message: `Data ingested: ${ingested}/${results.length} item(s)`,
+      results,
+    };
+  }
+
   @Post("error")
   @ApiOperation({ summary: "Report RPA error" })
   @ApiBody({ type: IngestErrorDto })
@@ -4,6 +4,7 @@ import { PrismaService } from "../core/prisma.service";
 import { nowDate, parseToDate } from "../core/date.util";
 import { PatientSyncService } from "./patient-sync.service";
 import {
+  IngestBatchDto,
   IngestDataDto,
   IngestDataType,
   IngestErrorDto,
@@ -184,6 +185,34 @@ export class IngestService {
     };
   }
 
+  async processIngestBatch(dto: IngestBatchDto) {
+    // Items are applied in order so a patient list still lands before the
+    // raw data that references it. Each item succeeds or fails on its own
+    // and reports its status, so the node knows which ones landed.
+    const results = [];
+    for (const item of dto.items) {
+      try {
+        const result = await this.processIngest({
+          uuid: dto.uuid,
+          hospitalType: dto.hospitalType,
+          dataType: item.dataType,
+          payload: item.payload,
+        });
+        results.push({ dataType: item.dataType, success: true, result });
+      } catch (error) {
+        this.logger.error(
+          `Ingest batch item ${item.dataType} from ${dto.uuid} failed: ${error.message}`,
+        );
+        results.push({
+          dataType: item.dataType,
+          success: false,
+          error: error.message,
+        });
+      }
+    }
+    return results;
+  }
+
   async handleRpaError(dto: IngestErrorDto) {
     this.logger.warn(
       `RPA Error from ${dto.uuid} at ${dto.hospitalType}: ${dto.error}`,